@@ -78,6 +78,96 @@ class TicTacToe():
     def available_moves(self):
         return [i for i, x in enumerate(self.board) if x == " "]
 
+# Every line of three as a 9-bit mask, and the lines through each square
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100                # diagonals
+)
+SQUARE_WIN_MASKS = [tuple(m for m in WIN_MASKS if m & (1 << sq)) for sq in range(9)]
+# Empty squares for every occupancy mask, precomputed once
+FREE_SQUARES = [tuple(i for i in range(9) if not occupied & (1 << i)) for occupied in range(512)]
+
+
+class BitBoard():
+    """Nine squares stored as one 9-bit integer per letter.
+
+    Indexing, slicing, iteration and count() behave like the list of
+    strings TicTacToe uses, so code that reads or undoes moves through
+    game.board keeps working.
+    """
+
+    def __init__(self):
+        self.bits = {'X': 0, 'O': 0}
+
+    def __getitem__(self, square):
+        if isinstance(square, slice):
+            return [self[i] for i in range(9)[square]]
+        bit = 1 << square
+        if self.bits['X'] & bit:
+            return 'X'
+        if self.bits['O'] & bit:
+            return 'O'
+        return ' '
+
+    def __setitem__(self, square, letter):
+        bit = 1 << square
+        self.bits['X'] &= ~bit
+        self.bits['O'] &= ~bit
+        if letter != ' ':
+            self.bits[letter] |= bit
+
+    def __iter__(self):
+        return (self[i] for i in range(9))
+
+    def __len__(self):
+        return 9
+
+    def __contains__(self, letter):
+        if letter == ' ':
+            return self.occupied() != 0b111111111
+        return letter in self.bits and self.bits[letter] != 0
+
+    def occupied(self):
+        return self.bits['X'] | self.bits['O']
+
+    def count(self, letter):
+        if letter == ' ':
+            return 9 - self.occupied().bit_count()
+        return self.bits[letter].bit_count() if letter in self.bits else 0
+
+
+class BitboardTicTacToe(TicTacToe):
+    def __init__(self):
+        self.board = BitBoard()
+        self.current_winner = None
+
+    def make_move(self, square, letter):
+        bit = 1 << square
+        if self.board.occupied() & bit:
+            return False
+        self.board.bits[letter] |= bit
+        if self.winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def winner(self, square, letter):
+        bits = self.board.bits[letter]
+        for mask in SQUARE_WIN_MASKS[square]:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def empty_squares(self):
+        return self.board.occupied() != 0b111111111
+
+    def num_empty_squares(self):
+        return 9 - self.board.occupied().bit_count()
+
+    def available_moves(self):
+        return list(FREE_SQUARES[self.board.occupied()])
+
+
 def play(game, x_player, o_player, print_game=True):
     if print_game:
         print(Fore.GREEN + "\n" + "═" * 40)
@@ -107,7 +197,8 @@ def play(game, x_player, o_player, print_game=True):
 
             letter = 'O' if letter == 'X' else 'X'
 
-        time.sleep(0.5)
+        if print_game:
+            time.sleep(0.5)
 
     if print_game:
         print(Fore.GREEN + "═" * 40)
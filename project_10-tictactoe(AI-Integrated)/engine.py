@@ -0,0 +1,163 @@
+import math
+
+# Every line of three on the board as a 9-bit mask (bit i = square i)
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100                # diagonals
+)
+FULL_BOARD = 0b111111111
+
+# Transposition table bound flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def _symmetries():
+    # The 8 rotations and reflections of the board, as square -> square maps
+    perms = []
+    for reflect in (False, True):
+        for turns in range(4):
+            perm = []
+            for square in range(9):
+                r, c = divmod(square, 3)
+                if reflect:
+                    c = 2 - c
+                for _ in range(turns):
+                    r, c = c, 2 - r
+                perm.append(r * 3 + c)
+            perms.append(tuple(perm))
+    return perms
+
+
+SYMMETRIES = _symmetries()
+# Each symmetry applied to every 9-bit mask, so transforming a board is a lookup
+SYMMETRY_TABLES = [
+    [sum(1 << perm[i] for i in range(9) if mask & (1 << i)) for mask in range(512)]
+    for perm in SYMMETRIES
+]
+
+
+def board_bits(board, letter):
+    """Return (mine, theirs) bitmasks for a list-of-strings board."""
+    bits = getattr(board, 'bits', None)
+    if bits is not None:  # BitBoard already holds the masks
+        other = 'O' if letter == 'X' else 'X'
+        return bits[letter], bits[other]
+
+    mine = theirs = 0
+    for i, cell in enumerate(board):
+        if cell == letter:
+            mine |= 1 << i
+        elif cell != ' ':
+            theirs |= 1 << i
+    return mine, theirs
+
+
+def has_won(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+class AlphaBetaSearch:
+    """Negamax search with alpha-beta pruning and a transposition table.
+
+    Positions are keyed from the point of view of the side to move, so the
+    table can be shared between both letters and kept across moves and games.
+    Keys are canonical under the board's 8 symmetries, and moves that a
+    symmetry of the current position maps onto each other are searched once.
+    Scores follow SmartComputerPlayer.minimax: a win is worth the number of
+    empty squares left plus one.
+    """
+
+    def __init__(self):
+        self.table = {}
+        self.nodes = 0
+
+    def best_move(self, mine, theirs):
+        """Return (position, score) for the side owning `mine`."""
+        self.nodes = 1
+
+        if has_won(theirs):
+            return None, -(self._empty(mine, theirs) + 1)
+        if mine | theirs == FULL_BOARD:
+            return None, 0
+
+        best_position, alpha = None, -math.inf
+        _, stabilizer = self._canonical(mine, theirs)
+        # Only the lowest square of each equivalent group is tried, so ties
+        # still resolve to the same square an exhaustive search would pick
+        for square in self._moves(mine, theirs, stabilizer):
+            score = -self._negamax(theirs, mine | (1 << square), -math.inf, -alpha)
+            # Strictly better only, so ties keep the lowest square like minimax
+            if score > alpha:
+                best_position, alpha = square, score
+        return best_position, alpha
+
+    def _negamax(self, mine, theirs, alpha, beta):
+        self.nodes += 1
+
+        # The previous move was made by `theirs`
+        if has_won(theirs):
+            return -(self._empty(mine, theirs) + 1)
+        if mine | theirs == FULL_BOARD:
+            return 0
+
+        key, stabilizer = self._canonical(mine, theirs)
+        entry = self.table.get(key)
+        if entry is not None:
+            value, flag = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha = alpha
+        best = -math.inf
+        for square in self._moves(mine, theirs, stabilizer):
+            score = -self._negamax(theirs, mine | (1 << square), -beta, -alpha)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (best, flag)
+        return best
+
+    @staticmethod
+    def _canonical(mine, theirs):
+        """Return the smallest key over all symmetries and the symmetries
+        that leave the position unchanged."""
+        key = None
+        stabilizer = []
+        for perm, table in zip(SYMMETRIES, SYMMETRY_TABLES):
+            m, t = table[mine], table[theirs]
+            candidate = m << 9 | t
+            if key is None or candidate < key:
+                key = candidate
+            if m == mine and t == theirs:
+                stabilizer.append(perm)
+        return key, stabilizer
+
+    @staticmethod
+    def _moves(mine, theirs, stabilizer):
+        occupied = mine | theirs
+        return [i for i in range(9)
+                if not occupied & (1 << i) and all(perm[i] >= i for perm in stabilizer)]
+
+    @staticmethod
+    def _empty(mine, theirs):
+        return 9 - (mine | theirs).bit_count()
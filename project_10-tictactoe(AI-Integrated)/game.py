@@ -1,6 +1,7 @@
 import math
 import time
 from colorama import Fore, Style, init
+from engine import WIN_MASKS, FULL_BOARD
 from player import HumanPlayer, RandomComputerPlayer, SmartComputerPlayer
 
 # Initialize colorama
@@ -79,6 +80,91 @@ class TicTacToe():
         return [i for i, x in enumerate(self.board) if x == " "]
 
 
+# The lines of three through each square
+SQUARE_WIN_MASKS = [tuple(m for m in WIN_MASKS if m & (1 << sq)) for sq in range(9)]
+# Empty squares for every occupancy mask, precomputed once
+FREE_SQUARES = [tuple(i for i in range(9) if not occupied & (1 << i)) for occupied in range(512)]
+
+
+class BitBoard():
+    """Nine squares stored as one 9-bit integer per letter.
+
+    Indexing, slicing, iteration and count() behave like the list of
+    strings TicTacToe uses, so code that reads or undoes moves through
+    game.board keeps working.
+    """
+
+    def __init__(self):
+        self.bits = {'X': 0, 'O': 0}
+
+    def __getitem__(self, square):
+        if isinstance(square, slice):
+            return [self[i] for i in range(9)[square]]
+        bit = 1 << square
+        if self.bits['X'] & bit:
+            return 'X'
+        if self.bits['O'] & bit:
+            return 'O'
+        return ' '
+
+    def __setitem__(self, square, letter):
+        bit = 1 << square
+        self.bits['X'] &= ~bit
+        self.bits['O'] &= ~bit
+        if letter != ' ':
+            self.bits[letter] |= bit
+
+    def __iter__(self):
+        return (self[i] for i in range(9))
+
+    def __len__(self):
+        return 9
+
+    def __contains__(self, letter):
+        if letter == ' ':
+            return self.occupied() != FULL_BOARD
+        return letter in self.bits and self.bits[letter] != 0
+
+    def occupied(self):
+        return self.bits['X'] | self.bits['O']
+
+    def count(self, letter):
+        if letter == ' ':
+            return 9 - self.occupied().bit_count()
+        return self.bits[letter].bit_count() if letter in self.bits else 0
+
+
+class BitboardTicTacToe(TicTacToe):
+    def __init__(self):
+        self.board = BitBoard()
+        self.current_winner = None
+
+    def make_move(self, square, letter):
+        bit = 1 << square
+        if self.board.occupied() & bit:
+            return False
+        self.board.bits[letter] |= bit
+        if self.winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def winner(self, square, letter):
+        bits = self.board.bits[letter]
+        for mask in SQUARE_WIN_MASKS[square]:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def empty_squares(self):
+        return self.board.occupied() != FULL_BOARD
+
+    def num_empty_squares(self):
+        return 9 - self.board.occupied().bit_count()
+
+    def available_moves(self):
+        return list(FREE_SQUARES[self.board.occupied()])
+
+
 def play(game, x_player, o_player, print_game=True):
     if print_game:
         print(Fore.GREEN + "\n" + "="*40)
@@ -108,7 +194,8 @@ def play(game, x_player, o_player, print_game=True):
 
             letter = 'O' if letter == 'X' else 'X'  # Switch player
 
-        time.sleep(0.8)
+        if print_game:
+            time.sleep(0.8)
 
     if print_game:
         print(Fore.GREEN + "="*40)
@@ -124,17 +211,19 @@ if __name__ == '__main__':
     print(Fore.WHITE + "2. Human vs Computer (Easy)")
     print(Fore.WHITE + "3. Human vs Computer (Hard)")
     print(Fore.WHITE + "4. Computer vs Computer (Demo)")
+    print(Fore.WHITE + "5. Human vs Computer (Gomoku 15x15, 5 in a row)")
     
     while True:
         try:
-            choice = int(input(Fore.CYAN + "\nEnter choice (1-4): "))
-            if 1 <= choice <= 4:
+            choice = int(input(Fore.CYAN + "\nEnter choice (1-5): "))
+            if 1 <= choice <= 5:
                 break
-            print(Fore.RED + "Please enter 1, 2, 3, or 4")
+            print(Fore.RED + "Please enter 1, 2, 3, 4, or 5")
         except ValueError:
             print(Fore.RED + "Please enter a number")
 
     # Player assignment
+    new_game = TicTacToe
     if choice == 1:
         x_player = HumanPlayer('X')
         o_player = HumanPlayer('O')
@@ -144,13 +233,18 @@ if __name__ == '__main__':
     elif choice == 3:
         x_player = HumanPlayer('X')
         o_player = SmartComputerPlayer('O')
-    else:  # Demo mode
+    elif choice == 4:  # Demo mode
         x_player = SmartComputerPlayer('X')
         o_player = RandomComputerPlayer('O')
+    else:
+        from mnk import MNKTicTacToe, MNKComputerPlayer
+        x_player = HumanPlayer('X')
+        o_player = MNKComputerPlayer('O', time_limit=2.0)
+        new_game = lambda: MNKTicTacToe(15, 15, 5)
 
     # Main game loop
     while True:
-        t = TicTacToe()
+        t = new_game()
         play(t, x_player, o_player)
         
         if input(Fore.MAGENTA + "\nPlay again? (y/n): ").lower() != 'y':
@@ -0,0 +1,288 @@
+import math
+import random
+import time
+from colorama import Fore
+from game import TicTacToe
+from player import Player
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+# Nodes searched between clock checks
+CLOCK_INTERVAL = 64
+# Least growth in time assumed from one depth to the next
+MIN_DEPTH_GROWTH = 2.0
+
+
+def line_windows(rows, cols, k):
+    """Every run of k squares in a row, column or diagonal."""
+    windows = []
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in DIRECTIONS:
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    windows.append(tuple((r + dr * i) * cols + c + dc * i for i in range(k)))
+    return windows
+
+
+class MNKTicTacToe(TicTacToe):
+    """TicTacToe on a rows x cols board where k in a row wins (15, 15, 5 is gomoku)."""
+
+    def __init__(self, rows=3, cols=3, k=3):
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.board = [' ' for _ in range(rows * cols)]
+        self.current_winner = None
+
+    def print_board(self):
+        print("\n")
+        for i in range(self.rows):
+            colored_row = []
+            for cell in self.board[i*self.cols:(i+1)*self.cols]:
+                if cell == 'X':
+                    colored_row.append(Fore.RED + cell)
+                elif cell == 'O':
+                    colored_row.append(Fore.BLUE + cell)
+                else:
+                    colored_row.append(Fore.WHITE + cell)
+            print(Fore.YELLOW + '| ' + ' | '.join(colored_row) + ' |')
+            if i < self.rows - 1:
+                print(Fore.YELLOW + '|' + '---|' * self.cols)
+
+    def print_board_nums(self):
+        width = len(str(len(self.board) - 1))
+        print("\nBoard Positions:")
+        for i in range(self.rows):
+            row = [str(j).rjust(width) for j in range(i*self.cols, (i+1)*self.cols)]
+            print(Fore.CYAN + '| ' + ' | '.join(row) + ' |')
+            if i < self.rows - 1:
+                print(Fore.CYAN + '|' + ('-' * (width + 2) + '|') * self.cols)
+
+    def winner(self, square, letter):
+        row, col = divmod(square, self.cols)
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * dr, col + sign * dc
+                while 0 <= r < self.rows and 0 <= c < self.cols and self.board[r*self.cols + c] == letter:
+                    count += 1
+                    r, c = r + sign * dr, c + sign * dc
+            if count >= self.k:
+                return True
+        return False
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class IterativeDeepeningSearch:
+    """Time-bounded negamax for m,n,k boards.
+
+    Each window of k squares keeps a stone count per letter, so placing or
+    removing a stone updates the evaluation and detects wins by touching only
+    the windows through that square. Search deepens one ply at a time until
+    the time budget runs out, reusing the transposition table's best moves to
+    order the next iteration.
+    """
+
+    def __init__(self, rows, cols, k, max_branch=12, radius=2, max_table=1_000_000):
+        self.size = rows * cols
+        self.center = (rows // 2) * cols + cols // 2
+        self.k = k
+        self.max_branch = max_branch
+        self.max_table = max_table
+        self.windows = line_windows(rows, cols, k)
+        self.square_windows = [[] for _ in range(self.size)]
+        for w, squares in enumerate(self.windows):
+            for square in squares:
+                self.square_windows[square].append(w)
+        self.neighbors = [
+            [nr * cols + nc
+             for nr in range(max(0, r - radius), min(rows, r + radius + 1))
+             for nc in range(max(0, c - radius), min(cols, c + radius + 1))
+             if (nr, nc) != (r, c)]
+            for r in range(rows) for c in range(cols)
+        ]
+
+        # An open window with n stones is worth 10**n; a finished one is a win
+        self.win_score = 10 ** (k + 4)
+        self.weights = [0] + [10 ** n for n in range(1, k)] + [self.win_score]
+        self.zobrist = [(random.getrandbits(64), random.getrandbits(64)) for _ in range(self.size)]
+        self.table = {}
+        self.nodes = 0
+        self.depth_reached = 0
+
+    def best_move(self, board, letter, time_limit=1.0):
+        """Return the best square for `letter` found within time_limit seconds."""
+        self._load(board)
+        side = 0 if letter == 'X' else 1
+        self.deadline = time.perf_counter() + time_limit
+        self.nodes = 0
+        self.depth_reached = 0
+        if len(self.table) > self.max_table:
+            self.table.clear()
+
+        best = self._ordered_moves(side, None)[0]
+        last_elapsed = None
+        for depth in range(1, self.size - self.stones + 1):
+            started = time.perf_counter()
+            try:
+                score = self._negamax(depth, -math.inf, math.inf, side, 0)
+            except SearchTimeout:
+                break
+            best = self.table[self.hash][3]
+            self.depth_reached = depth
+            if abs(score) >= self.win_score - self.size:
+                break  # Forced result found, deeper search cannot change it
+            # Skip a depth that would only be cut off: guess its time from how the last one grew
+            finished = time.perf_counter()
+            elapsed = finished - started
+            growth = max(MIN_DEPTH_GROWTH, elapsed / last_elapsed) if last_elapsed else MIN_DEPTH_GROWTH
+            if finished + elapsed * growth > self.deadline:
+                break
+            last_elapsed = elapsed
+        return best
+
+    def _load(self, board):
+        self.cells = [None] * self.size
+        self.counts = [[0, 0] for _ in self.windows]
+        self.near = [0] * self.size
+        self.score = 0  # From X's point of view
+        self.hash = 0
+        self.stones = 0
+        for square, cell in enumerate(board):
+            if cell != ' ':
+                self._place(square, 0 if cell == 'X' else 1)
+
+    def _window_value(self, counts):
+        x, o = counts
+        if o == 0:
+            return self.weights[x]
+        if x == 0:
+            return -self.weights[o]
+        return 0
+
+    def _place(self, square, side):
+        """Put a stone down and return True if it completes k in a row."""
+        won = False
+        for w in self.square_windows[square]:
+            counts = self.counts[w]
+            before = self._window_value(counts)
+            counts[side] += 1
+            if counts[side] == self.k:
+                won = True
+            self.score += self._window_value(counts) - before
+        self.cells[square] = side
+        self.hash ^= self.zobrist[square][side]
+        self.stones += 1
+        for n in self.neighbors[square]:
+            self.near[n] += 1
+        return won
+
+    def _remove(self, square, side):
+        for w in self.square_windows[square]:
+            counts = self.counts[w]
+            before = self._window_value(counts)
+            counts[side] -= 1
+            self.score += self._window_value(counts) - before
+        self.cells[square] = None
+        self.hash ^= self.zobrist[square][side]
+        self.stones -= 1
+        for n in self.neighbors[square]:
+            self.near[n] -= 1
+
+    def _ordered_moves(self, side, tt_move):
+        cells, near = self.cells, self.near
+        moves = [sq for sq in range(self.size) if cells[sq] is None and near[sq]]
+        if not moves:
+            return [self.center] if cells[self.center] is None else \
+                [sq for sq in range(self.size) if cells[sq] is None]
+
+        # Rank by how much each square extends our lines plus blocks theirs
+        def priority(square):
+            total = 0
+            for w in self.square_windows[square]:
+                own, other = self.counts[w][side], self.counts[w][1 - side]
+                if other == 0:
+                    total += self.weights[own + 1]
+                if own == 0:
+                    total += self.weights[other + 1]
+            return total
+
+        moves.sort(key=priority, reverse=True)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves[:self.max_branch]
+
+    def _negamax(self, depth, alpha, beta, side, ply):
+        self.nodes += 1
+        if self.nodes % CLOCK_INTERVAL == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+
+        if self.stones == self.size:
+            return 0
+        if depth == 0:
+            return self.score if side == 0 else -self.score
+
+        entry = self.table.get(self.hash)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, flag, tt_move = entry
+            if entry_depth >= depth:
+                if flag == 'exact':
+                    return value
+                if flag == 'lower':
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        original_alpha = alpha
+        best, best_move = -math.inf, None
+        for square in self._ordered_moves(side, tt_move):
+            if self._place(square, side):
+                score = self.win_score - ply  # Prefer the quickest win
+            else:
+                score = -self._negamax(depth - 1, -beta, -alpha, 1 - side, ply + 1)
+            self._remove(square, side)
+
+            if score > best:
+                best, best_move = score, square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            flag = 'upper'
+        elif best >= beta:
+            flag = 'lower'
+        else:
+            flag = 'exact'
+        self.table[self.hash] = (depth, best, flag, best_move)
+        return best
+
+
+class MNKComputerPlayer(Player):
+    def __init__(self, letter, time_limit=1.0, max_branch=12):
+        super().__init__(letter)
+        self.time_limit = time_limit
+        self.max_branch = max_branch
+        self.search = None
+        self.search_shape = None
+
+    def get_move(self, game):
+        shape = (game.rows, game.cols, game.k)
+        if self.search_shape != shape:
+            self.search = IterativeDeepeningSearch(*shape, max_branch=self.max_branch)
+            self.search_shape = shape
+
+        if not self.quiet:
+            print(self.color + f"\nComputer {self.letter} is thinking hard...")
+        square = self.search.best_move(game.board, self.letter, self.time_limit)
+        if not self.quiet:
+            print(self.color + f"Searched {self.search.nodes} positions to depth {self.search.depth_reached}")
+        return square
@@ -0,0 +1,87 @@
+import mmap
+import os
+from engine import AlphaBetaSearch, has_won, FULL_BOARD
+
+# Each position is stored at its base-3 index (empty=0, X=1, O=2 per square)
+# as two bytes: best square for the side to move and its score (signed).
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+NUM_INDEXES = 3 ** 9
+RECORD_SIZE = 2
+NO_MOVE = 0xFF
+
+# Base-3 weight of every 9-bit mask, so an index is two table lookups
+BASE3 = [sum(3 ** i for i in range(9) if mask & (1 << i)) for mask in range(512)]
+
+
+def position_index(x_bits, o_bits):
+    return BASE3[x_bits] + 2 * BASE3[o_bits]
+
+
+def build_book(path=BOOK_PATH):
+    """Solve every legal position from the empty board and write the book."""
+    engine = AlphaBetaSearch()
+    data = bytearray([NO_MOVE, 0] * NUM_INDEXES)
+    seen = set()
+    stack = [(0, 0)]
+
+    while stack:
+        x_bits, o_bits = stack.pop()
+        if (x_bits, o_bits) in seen:
+            continue
+        seen.add((x_bits, o_bits))
+        if has_won(x_bits) or has_won(o_bits) or x_bits | o_bits == FULL_BOARD:
+            continue
+
+        x_to_move = x_bits.bit_count() == o_bits.bit_count()
+        if x_to_move:
+            square, score = engine.best_move(x_bits, o_bits)
+        else:
+            square, score = engine.best_move(o_bits, x_bits)
+        offset = position_index(x_bits, o_bits) * RECORD_SIZE
+        data[offset] = square
+        data[offset + 1] = score & 0xFF
+
+        for i in range(9):
+            bit = 1 << i
+            if (x_bits | o_bits) & bit:
+                continue
+            if x_to_move:
+                stack.append((x_bits | bit, o_bits))
+            else:
+                stack.append((x_bits, o_bits | bit))
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(seen)
+
+
+class OpeningBook:
+    """Memory-mapped perfect-play table produced by build_book."""
+
+    def __init__(self, path=BOOK_PATH):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) != NUM_INDEXES * RECORD_SIZE:
+            raise ValueError(f"{path} is not a tic-tac-toe opening book")
+
+    def lookup(self, x_bits, o_bits):
+        """Return (square, score) for the side to move, or (None, None)."""
+        offset = position_index(x_bits, o_bits) * RECORD_SIZE
+        square = self.data[offset]
+        if square == NO_MOVE:
+            return None, None
+        score = self.data[offset + 1]
+        return square, score - 256 if score > 127 else score
+
+
+def load_book(path=BOOK_PATH):
+    """Open the book if it has been generated, otherwise return None."""
+    try:
+        return OpeningBook(path)
+    except (OSError, ValueError):
+        return None
+
+
+if __name__ == '__main__':
+    positions = build_book()
+    print(f"Solved {positions} positions, book written to {BOOK_PATH}")
@@ -1,10 +1,16 @@
-import math
 import random
+import time
 from colorama import Fore, Style
+from engine import AlphaBetaSearch, board_bits
+from opening_book import load_book
+
+# Perfect-play table for every position; None until opening_book.py is run
+BOOK = load_book()
 
 class Player():
     def __init__(self, letter):
         self.letter = letter
+        self.quiet = False  # Headless runs skip the thinking messages and delays
         self.color = Fore.RED if letter == 'X' else Fore.BLUE
 
     def get_move(self, game):
@@ -19,7 +25,7 @@ class HumanPlayer(Player):
         valid_square = False
         val = None
         while not valid_square:
-            square = input(self.color + f"\n{self.letter}'s turn. Input move (0-8): ")
+            square = input(self.color + f"\n{self.letter}'s turn. Input move (0-{len(game.board) - 1}): ")
             try:
                 val = int(square)
                 if val not in game.available_moves():
@@ -35,52 +41,45 @@ class RandomComputerPlayer(Player):
         super().__init__(letter)
 
     def get_move(self, game):
-        print(self.color + f"\nComputer {self.letter} is thinking...")
-        time.sleep(1)  # Simulate thinking
+        if not self.quiet:
+            print(self.color + f"\nComputer {self.letter} is thinking...")
+            time.sleep(1)  # Simulate thinking
         return random.choice(game.available_moves())
 
 
 class SmartComputerPlayer(Player):
     def __init__(self, letter):
         super().__init__(letter)
+        self.engine = AlphaBetaSearch()
+        self.nodes_per_move = []
 
     def get_move(self, game):
         if len(game.available_moves()) == 9:
             square = random.choice(game.available_moves())  # Random first move
         else:
-            print(self.color + f"\nComputer {self.letter} is thinking hard...")
-            time.sleep(1.5)  # Simulate deeper thinking
-            square = self.minimax(game, self.letter)['position']
+            if not self.quiet:
+                print(self.color + f"\nComputer {self.letter} is thinking hard...")
+                time.sleep(1.5)  # Simulate deeper thinking
+            square = self.book_move(game)
+            if square is None:
+                square = self.minimax(game, self.letter)['position']
+                if not self.quiet:
+                    print(self.color + f"Searched {self.engine.nodes} positions")
         return square
 
-    def minimax(self, state, player):
-        max_player = self.letter
-        other_player = 'O' if player == 'X' else 'X'
-
-        if state.current_winner == other_player:
-            return {
-                'position': None,
-                'score': 1 * (state.num_empty_squares() + 1) if other_player == max_player 
-                else -1 * (state.num_empty_squares() + 1)
-            }
-        elif not state.empty_squares():
-            return {'position': None, 'score': 0}
+    def book_move(self, game):
+        if BOOK is None:
+            return None
+        x_bits, o_bits = board_bits(game.board, 'X')
+        return BOOK.lookup(x_bits, o_bits)[0]
 
-        best = {'position': None, 'score': -math.inf if player == max_player else math.inf}
-        
-        for possible_move in state.available_moves():
-            state.make_move(possible_move, player)
-            sim_score = self.minimax(state, other_player)
-
-            # Undo move
-            state.board[possible_move] = ' '
-            state.current_winner = None
-            sim_score['position'] = possible_move
-
-            if player == max_player:
-                if sim_score['score'] > best['score']:
-                    best = sim_score
-            else:
-                if sim_score['score'] < best['score']:
-                    best = sim_score
-        return best
\ No newline at end of file
+    def minimax(self, state, player):
+        # Alpha-beta search; the transposition table persists between moves
+        mine, theirs = board_bits(state.board, player)
+        position, score = self.engine.best_move(mine, theirs)
+        self.nodes_per_move.append(self.engine.nodes)
+
+        # Engine scores are for the side to move, minimax scores for self.letter
+        if player != self.letter:
+            score = -score
+        return {'position': position, 'score': score}
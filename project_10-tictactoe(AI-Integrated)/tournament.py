@@ -0,0 +1,163 @@
+import argparse
+import importlib
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from colorama import Fore, init
+from game import TicTacToe, BitboardTicTacToe
+from player import RandomComputerPlayer, SmartComputerPlayer
+
+# Initialize colorama
+init(autoreset=True)
+
+PLAYERS = {
+    'random': RandomComputerPlayer,
+    'smart': SmartComputerPlayer,
+}
+
+
+def resolve_player(name):
+    """Look up a built-in player name or a 'module:ClassName' path."""
+    if name in PLAYERS:
+        return PLAYERS[name]
+    module_name, _, class_name = name.partition(':')
+    if not class_name:
+        raise ValueError(f"Unknown player '{name}'. Use one of {sorted(PLAYERS)} or module:ClassName")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def make_player(name, letter):
+    player = resolve_player(name)(letter)
+    player.quiet = True
+    return player
+
+
+def play_headless(game, x_player, o_player):
+    """Play one game without output; return (winner, {letter: [move seconds]})."""
+    latencies = {'X': [], 'O': []}
+    letter = 'X'
+    while game.empty_squares():
+        player = x_player if letter == 'X' else o_player
+        start = time.perf_counter()
+        square = player.get_move(game)
+        latencies[letter].append(time.perf_counter() - start)
+
+        if not game.make_move(square, letter):
+            raise ValueError(f"{type(player).__name__} played illegal square {square}")
+        if game.current_winner:
+            return letter, latencies
+        letter = 'O' if letter == 'X' else 'X'
+    return None, latencies
+
+
+def run_batch(job):
+    """Play a block of games in one worker; player A takes X on even games."""
+    name_a, name_b, first_game, num_games, bitboard, seed = job
+    random.seed(None if seed is None else seed + first_game)
+    board_class = BitboardTicTacToe if bitboard else TicTacToe
+
+    # Players are reused across the block so search tables stay warm
+    a_players = {letter: make_player(name_a, letter) for letter in 'XO'}
+    b_players = {letter: make_player(name_b, letter) for letter in 'XO'}
+
+    tally = {'wins': 0, 'draws': 0, 'losses': 0}
+    latencies = {'a': [], 'b': []}
+    for game_index in range(first_game, first_game + num_games):
+        a_letter = 'X' if game_index % 2 == 0 else 'O'
+        b_letter = 'O' if a_letter == 'X' else 'X'
+        players = {a_letter: a_players[a_letter], b_letter: b_players[b_letter]}
+
+        winner, move_times = play_headless(board_class(), players['X'], players['O'])
+        if winner is None:
+            tally['draws'] += 1
+        elif winner == a_letter:
+            tally['wins'] += 1
+        else:
+            tally['losses'] += 1
+        latencies['a'].extend(move_times[a_letter])
+        latencies['b'].extend(move_times[b_letter])
+    return tally, latencies
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_tournament(name_a, name_b, num_games=1000, workers=None, batch_size=100,
+                   bitboard=False, seed=None):
+    """Play name_a against name_b num_games times over a process pool."""
+    jobs = [(name_a, name_b, first, min(batch_size, num_games - first), bitboard, seed)
+            for first in range(0, num_games, batch_size)]
+
+    tally = {'wins': 0, 'draws': 0, 'losses': 0}
+    latencies = {'a': [], 'b': []}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch_tally, batch_latencies in pool.map(run_batch, jobs):
+            for key in tally:
+                tally[key] += batch_tally[key]
+            for key in latencies:
+                latencies[key].extend(batch_latencies[key])
+    elapsed = time.perf_counter() - start
+
+    results = {
+        'player_a': name_a,
+        'player_b': name_b,
+        'games': num_games,
+        'seconds': elapsed,
+        'games_per_sec': num_games / elapsed if elapsed else 0.0,
+        **tally,
+    }
+    for key, name in (('a', name_a), ('b', name_b)):
+        values = sorted(latencies[key])
+        results[f'latency_{key}'] = {
+            'player': name,
+            'moves': len(values),
+            **{f'p{p}': percentile(values, p) for p in (50, 90, 99)},
+            'max': values[-1] if values else 0.0,
+        }
+    return results
+
+
+def print_report(results):
+    games = results['games']
+    print(Fore.GREEN + "\n" + "="*50)
+    print(Fore.YELLOW + f"  {results['player_a']} vs {results['player_b']} - {games} games")
+    print(Fore.GREEN + "="*50)
+    for key, color in (('wins', Fore.GREEN), ('draws', Fore.WHITE), ('losses', Fore.RED)):
+        print(color + f"{key.capitalize():>8}: {results[key]:7d} ({results[key] / games:6.1%})")
+    print(Fore.CYAN + f"\n{results['games_per_sec']:.1f} games/sec ({results['seconds']:.2f}s total)")
+
+    print(Fore.MAGENTA + "\nMove latency (ms):     p50       p90       p99       max")
+    for key in ('latency_a', 'latency_b'):
+        stats = results[key]
+        print(Fore.WHITE + f"{stats['player']:>16}: " + " ".join(
+            f"{stats[p] * 1000:9.4f}" for p in ('p50', 'p90', 'p99', 'max')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless tic-tac-toe tournament between two players")
+    parser.add_argument('player_a', help="random, smart or module:ClassName")
+    parser.add_argument('player_b', help="random, smart or module:ClassName")
+    parser.add_argument('-n', '--games', type=int, default=1000)
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--bitboard', action='store_true', help="play on BitboardTicTacToe")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    # Fail fast on bad names before starting the pool
+    resolve_player(args.player_a)
+    resolve_player(args.player_b)
+
+    results = run_tournament(args.player_a, args.player_b, args.games, args.workers,
+                             args.batch_size, args.bitboard, args.seed)
+    print_report(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+import csv
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+import numpy as np
+
+# Columns of an exported result record, in CSV order
+FIELDS = ['engine', 'workload', 'size', 'repeat', 'median', 'q1', 'q3', 'iqr',
+          'ci_low', 'ci_high', 'mean', 'stdev', 'min', 'max', 'queries_per_sec']
+
+
+def measure(func, repeat=5, warmup=1):
+    """Time func() `repeat` times after `warmup` untimed calls.
+
+    The garbage collector is disabled while timing so a collection that
+    happens to land in one trial does not skew it; it is restored after.
+    """
+    for _ in range(warmup):
+        func()
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return summarize(samples)
+
+
+def summarize(samples):
+    """Median, quartiles and a 95% confidence interval for the median of timing samples.
+
+    The interval comes from order statistics, so it assumes nothing about
+    the shape of the timing distribution; with few samples it is simply
+    as wide as the samples themselves.
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n > 1:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method='inclusive')
+    else:
+        q1 = q3 = ordered[0]
+    spread = 1.96 * math.sqrt(n) / 2
+    low = max(0, math.floor(n / 2 - spread))
+    high = min(n - 1, math.ceil(n / 2 + spread) - 1)
+    return {
+        'repeat': n,
+        'median': statistics.median(ordered),
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'ci_low': ordered[low],
+        'ci_high': ordered[high],
+        'mean': statistics.fmean(ordered),
+        'stdev': statistics.stdev(ordered) if n > 1 else 0.0,
+        'min': ordered[0],
+        'max': ordered[-1],
+    }
+
+
+def scale(stats, factor):
+    """Stats with every timing divided by factor, e.g. to get per-query times."""
+    return {key: value / factor if key != 'repeat' else value for key, value in stats.items()}
+
+
+def write_json(records, path, config=None):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'config': config or {}, 'results': records}, file, indent=2)
+
+
+def write_csv(records, path):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def git_info(path='.'):
+    """Commit hash of the checkout at path and whether it has uncommitted changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=path, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        # Untracked files such as result stores and plots do not change the code under test
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=path,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+    return {'commit': commit, 'dirty': bool(status.strip())}
+
+
+def machine_info():
+    return {
+        'hostname': platform.node(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+    }
+
+
+def append_run(path, records, config, source_dir='.'):
+    """Append one run, tagged with commit and machine, to a JSON Lines results store."""
+    run = {
+        'run_id': datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S.%fZ'),
+        'git': git_info(source_dir),
+        'machine': machine_info(),
+        'config': config,
+        'results': records,
+    }
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(run) + '\n')
+    return run
+
+
+def load_runs(path):
+    """Every run in a results store, oldest first."""
+    with open(path, 'r', encoding='utf-8') as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -0,0 +1,198 @@
+import argparse
+import os
+import sys
+import matplotlib
+matplotlib.use('Agg')  # Headless: write image files, never open a window
+import matplotlib.pyplot as plt
+from colorama import Fore, Style
+from bench import append_run, load_runs
+from main import SearchBenchmark
+from workloads import WORKLOADS
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE = os.path.join(PROJECT_DIR, 'benchmark_runs.jsonl')
+
+
+def run(args):
+    benchmark = SearchBenchmark()
+    if args.mode == 'index':
+        benchmark.run_index_benchmark(sizes=args.sizes, num_queries=args.queries, repeat=args.repeat,
+                                      warmup=args.warmup, seed=args.seed)
+    else:
+        benchmark.run_benchmark(args.min_size, args.max_size, args.step, args.repeat, args.warmup,
+                                args.workload, args.seed)
+    config = {'mode': args.mode, **benchmark.config}
+    stored = append_run(args.store, benchmark.records, config, PROJECT_DIR)
+    commit = stored['git']['commit'] or 'unknown commit'
+    print(f"\n{Fore.GREEN}✅ Run {stored['run_id']} ({commit[:10]}) appended to {args.store}{Style.RESET_ALL}")
+    if args.plot:
+        benchmark.visualize_results(args.plot, show=False)
+
+
+def select_run(runs, key):
+    """A run by '@' and list index (@-1 is the newest) or by run_id prefix.
+
+    Run ids start with a date, so a bare number is always read as a prefix.
+    """
+    if key.startswith('@'):
+        try:
+            return runs[int(key[1:])]
+        except ValueError:
+            raise ValueError(f"Bad run index '{key}', use e.g. @0 or @-1")
+        except IndexError:
+            raise ValueError(f"Only {len(runs)} runs stored, no run {key}")
+    matches = [r for r in runs if r['run_id'].startswith(key)]
+    if len(matches) != 1:
+        raise ValueError(f"Run '{key}' matches {len(matches)} stored runs")
+    return matches[0]
+
+
+def medians(run):
+    """{(engine, workload, size): median seconds per query} for a stored run."""
+    return {(r['engine'], r['workload'], r['size']): r['median'] for r in run['results']}
+
+
+def speedups(baseline, target):
+    """{(engine, workload, size): baseline median / target median}; above 1 means target is faster."""
+    before, after = medians(baseline), medians(target)
+    return {key: before[key] / after[key] for key in sorted(before.keys() & after.keys()) if after[key]}
+
+
+def run_label(run):
+    commit = run['git']['commit'] or 'unknown'
+    dirty = '+' if run['git']['dirty'] else ''
+    return f"{commit[:8]}{dirty} {run['run_id'][:15]}"
+
+
+def plot_comparison(runs, baseline, target, path):
+    """Log-log time per query of every given run, and target's speedup over baseline per engine.
+
+    The speedup panel is left out when the two runs share no measurements.
+    """
+    ratios = speedups(baseline, target)
+    if ratios:
+        fig, (times_ax, speedup_ax) = plt.subplots(1, 2, figsize=(16, 6))
+    else:
+        fig, times_ax = plt.subplots(figsize=(8, 6))
+    colors = {}
+    styles = ['-', '--', ':', '-.']
+    for run_index, stored in enumerate(runs):
+        by_engine = {}
+        for (engine, workload, size), median in sorted(medians(stored).items()):
+            by_engine.setdefault((engine, workload), []).append((size, median))
+        for (engine, workload), points in by_engine.items():
+            color = colors.setdefault(engine, f"C{len(colors) % 10}")
+            times_ax.plot([p[0] for p in points], [p[1] for p in points], styles[run_index % len(styles)],
+                          color=color, label=f"{engine} ({workload}) {run_label(stored)}")
+    times_ax.set_xscale('log')
+    times_ax.set_yscale('log')
+    times_ax.set_xlabel('List Size')
+    times_ax.set_ylabel('Median time per query (seconds)')
+    times_ax.set_title('Time per query across runs')
+    times_ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    times_ax.legend(fontsize=6)
+
+    if ratios:
+        by_engine = {}
+        for (engine, workload, size), ratio in ratios.items():
+            by_engine.setdefault((engine, workload), []).append((size, ratio))
+        for (engine, workload), points in by_engine.items():
+            speedup_ax.plot([p[0] for p in points], [p[1] for p in points], marker='o',
+                            color=colors.setdefault(engine, f"C{len(colors) % 10}"), label=f"{engine} ({workload})")
+        speedup_ax.axhline(1.0, color='black', linewidth=1)
+        speedup_ax.set_xscale('log')
+        speedup_ax.set_xlabel('List Size')
+        speedup_ax.set_ylabel('Speedup (baseline / target)')
+        speedup_ax.set_title(f"{run_label(target)} vs {run_label(baseline)}")
+        speedup_ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+        speedup_ax.legend(fontsize=8)
+
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+
+def compare(args):
+    runs = load_runs(args.store)
+    if not runs:
+        raise ValueError(f"No runs stored in {args.store}")
+    # With a single stored run there is no previous one, so it is compared with itself
+    baseline = select_run(runs, args.baseline if len(runs) > 1 else args.target)
+    target = select_run(runs, args.target)
+    shown = runs[-args.last:] if args.last else runs
+    if baseline not in shown:
+        shown = [baseline] + shown
+
+    ratios = speedups(baseline, target)
+    print(f"\n{Fore.YELLOW}{run_label(target)} vs baseline {run_label(baseline)}{Style.RESET_ALL}")
+    regressions = 0
+    for (engine, workload, size), ratio in ratios.items():
+        slower = ratio < 1 / (1 + args.threshold / 100)
+        regressions += slower
+        color = Fore.RED if slower else Fore.GREEN if ratio > 1 + args.threshold / 100 else Fore.WHITE
+        print(f"{color}{engine:>16} {workload:>12} {size:>12,}: {ratio:6.2f}x"
+              f"{'  REGRESSION' if slower else ''}")
+    if not ratios:
+        print(f"{Fore.RED}The two runs share no engine, workload and size; "
+              f"the speedup panel is skipped{Style.RESET_ALL}")
+
+    plot_comparison(shown, baseline, target, args.out)
+    print(f"\n{Fore.GREEN}✅ Comparison saved as {args.out}{Style.RESET_ALL}")
+    return regressions
+
+
+def list_runs(args):
+    for index, stored in enumerate(load_runs(args.store)):
+        config = stored['config']
+        print(f"{Fore.CYAN}{'@' + str(index):>4} {run_label(stored)} {Fore.WHITE}{config.get('mode')} "
+              f"{config.get('workload')} | {stored['machine']['hostname']} "
+              f"({stored['machine']['processor']}, {stored['machine']['cpu_count']} CPUs)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless search benchmark runs and comparison reports")
+    parser.add_argument('--store', default=DEFAULT_STORE, help="JSON Lines results store")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run a benchmark and append it to the store")
+    run_parser.add_argument('--mode', choices=['sweep', 'index'], default='sweep')
+    run_parser.add_argument('--min-size', type=int, default=1000)
+    run_parser.add_argument('--max-size', type=int, default=20000)
+    run_parser.add_argument('--step', type=int, default=2000)
+    run_parser.add_argument('--workload', choices=sorted(WORKLOADS), default='sequential')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[10**4, 10**5, 10**6, 10**7],
+                            help="sizes for --mode index")
+    run_parser.add_argument('--queries', type=int, default=100_000, help="queries per size for --mode index")
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--warmup', type=int, default=1)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--plot', default=None, help="also save this run's plot here")
+
+    compare_parser = commands.add_parser('compare', help="plot stored runs and speedups between two of them")
+    compare_parser.add_argument('--baseline', default='@-2',
+                                help="@index (as listed) or run_id prefix (default: previous run)")
+    compare_parser.add_argument('--target', default='@-1',
+                                help="@index (as listed) or run_id prefix (default: latest run)")
+    compare_parser.add_argument('--last', type=int, default=4, help="runs to draw in the log-log panel (0 for all)")
+    compare_parser.add_argument('--threshold', type=float, default=10.0,
+                                help="percent slowdown reported as a regression")
+    compare_parser.add_argument('--fail-on-regression', action='store_true', help="exit with status 1 on any regression")
+    compare_parser.add_argument('-o', '--out', default='benchmark_comparison.png')
+
+    commands.add_parser('list', help="list stored runs")
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'run':
+            run(args)
+        elif args.command == 'list':
+            list_runs(args)
+        elif compare(args) and args.fail_on_regression:
+            sys.exit(1)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import math
+import os
+import numpy as np
+
+# Seeded datasets are saved here and memory-mapped on later runs
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dataset_cache')
+
+
+def sample_sorted_unique(length, low, high, seed=None):
+    """`length` distinct integers drawn uniformly from [low, high], sorted, as int64.
+
+    Every integer is first kept independently with probability p, slightly
+    above length / population. The kept values come straight out in sorted
+    order as a running sum of geometric gaps, so nothing is sorted and
+    only about `length` random numbers are drawn. A random subset of the
+    small surplus is then dropped, which leaves a uniform sample of exactly
+    `length` values.
+    """
+    population = high - low + 1
+    if not 0 <= length <= population:
+        raise ValueError(f"Cannot draw {length} distinct values from {population}")
+    rng = np.random.default_rng(seed)
+    if length == 0:
+        return np.empty(0, dtype=np.int64)
+    if length == population:
+        return np.arange(low, high + 1, dtype=np.int64)
+
+    p = min(1.0, (length + 4 * math.sqrt(length) + 10) / population)
+    while True:
+        expected = population * p
+        keys = np.cumsum(rng.geometric(p, size=int(expected + 6 * math.sqrt(expected)) + 10),
+                         dtype=np.int64)
+        # Keep drawing gaps until the running sum passes the end of the range
+        while keys[-1] < population:
+            more = np.cumsum(rng.geometric(p, size=int(6 * math.sqrt(expected)) + 10), dtype=np.int64)
+            keys = np.concatenate([keys, keys[-1] + more])
+        keys = keys[:np.searchsorted(keys, population, side='right')]
+        if len(keys) >= length:
+            break
+    surplus = len(keys) - length
+    if surplus:
+        keys = np.delete(keys, rng.choice(len(keys), size=surplus, replace=False))
+    # Gaps start at 1, so the sums index the population from 1
+    keys += low - 1
+    return keys
+
+
+def load_sorted_keys(length, seed=None, cache_dir=CACHE_DIR):
+    """Sorted unique keys in [-3*length, 3*length], the range generate_sorted_list has always used.
+
+    With a seed the dataset is saved as .npy under cache_dir the first time
+    and memory-mapped read-only afterwards, so large sizes are generated
+    once and reused across runs. Without a seed it is drawn fresh each time.
+    """
+    if seed is None:
+        return sample_sorted_unique(length, -3 * length, 3 * length)
+    path = os.path.join(cache_dir, f'sorted_{length}_seed{seed}.npy')
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        keys = sample_sorted_unique(length, -3 * length, 3 * length, seed)
+        # Write under a temporary name first so an interrupted run leaves no partial file
+        tmp_path = path + '.tmp.npy'
+        np.save(tmp_path, keys)
+        os.replace(tmp_path, path)
+    return np.load(path, mmap_mode='r')
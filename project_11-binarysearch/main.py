@@ -1,23 +1,88 @@
 import random
 import time
+from bisect import bisect_left
 import matplotlib.pyplot as plt
 from colorama import Fore, Style, init
 import sys
 import numpy as np
+from bench import measure, scale, write_csv, write_json
+from datasets import load_sorted_keys
+from sorted_index import SortedIndex
+from workloads import WORKLOADS, merge_lookup
+
+# List-based engines are skipped above this size, where a list of boxed ints
+# would need several GB
+MAX_LIST_SIZE = 10_000_000
 
 # Initialize colorama
 init(autoreset=True)
 
 class SearchBenchmark:
     def __init__(self):
-        self.results = {
-            'native': [],
-            'binary': [],
-            'sizes': []
+        # Per-query engines take (list, target) and return its index or -1
+        self.engines = {
+            'native': self.native_search,
+            'binary': self.binary_search,
+            'iterative': self.iterative_binary_search,
+            'bisect': self.bisect_search,
+            'interpolation': self.interpolation_search,
+            'exponential': self.exponential_search,
+            'index': SortedIndex.find,
+            'eytzinger': SortedIndex.find,
+        }
+        # Batch engines take (keys, targets) and answer every query in one call
+        self.batch_engines = {
+            'numpy': self.numpy_batch_search,
+            'merge': merge_lookup,
+            'index_batch': SortedIndex.find_batch,
+            'eytzinger_batch': SortedIndex.find_batch,
+        }
+        # Engines that search their own structure get it built from the sorted
+        # list once per size, outside timing; the rest search the list itself
+        self.builders = {
+            'numpy': np.asarray,
+            'index': SortedIndex,
+            'eytzinger': self.eytzinger_index,
+            'index_batch': SortedIndex,
+            'eytzinger_batch': self.eytzinger_index,
+        }
+        # Batch engines get their targets in this container
+        self.batch_inputs = {
+            'numpy': np.asarray,
+            'merge': list,
+            'index_batch': np.asarray,
+            'eytzinger_batch': np.asarray,
         }
+        self.labels = {
+            'native': 'Native Search',
+            'binary': 'Binary Search',
+            'iterative': 'Iterative Binary',
+            'bisect': 'Bisect',
+            'interpolation': 'Interpolation',
+            'exponential': 'Exponential',
+            'index': 'Array index',
+            'eytzinger': 'Eytzinger index',
+            'numpy': 'NumPy searchsorted (batch)',
+            'merge': 'Merge lookup (batch)',
+            'index_batch': 'Array index (batch)',
+            'eytzinger_batch': 'Eytzinger index (batch)',
+        }
+        # One record of per-query timing stats per engine and size in the last run, for export
+        self.records = []
+        self.config = {}
         self.colors = {
             'native': Fore.RED,
             'binary': Fore.GREEN,
+            'iterative': Fore.BLUE,
+            'bisect': Fore.MAGENTA,
+            'interpolation': Fore.YELLOW,
+            'exponential': Fore.WHITE,
+            'numpy': Fore.LIGHTGREEN_EX,
+            'merge': Fore.LIGHTBLUE_EX,
+            'index': Fore.LIGHTCYAN_EX,
+            'eytzinger': Fore.LIGHTMAGENTA_EX,
+            'index_batch': Fore.LIGHTYELLOW_EX,
+            'eytzinger_batch': Fore.LIGHTRED_EX,
             'text': Fore.CYAN
         }
 
@@ -45,61 +110,203 @@ class SearchBenchmark:
         else:
             return self.binary_search(l, target, midpoint + 1, high)
 
-    def generate_sorted_list(self, length):
-        unique_set = set()
-        while len(unique_set) < length:
-            unique_set.add(random.randint(-3*length, 3*length))
-        return sorted(list(unique_set))
+    def iterative_binary_search(self, l, target):
+        low, high = 0, len(l) - 1
+        while low <= high:
+            midpoint = (low + high) // 2
+            value = l[midpoint]
+            if value == target:
+                return midpoint
+            if target < value:
+                high = midpoint - 1
+            else:
+                low = midpoint + 1
+        return -1
+
+    def bisect_search(self, l, target):
+        i = bisect_left(l, target)
+        return i if i < len(l) and l[i] == target else -1
+
+    def interpolation_search(self, l, target):
+        """Probe where target would sit if values were evenly spread between l[low] and l[high]."""
+        low, high = 0, len(l) - 1
+        while low <= high and l[low] <= target <= l[high]:
+            if l[high] == l[low]:
+                return low if l[low] == target else -1
+            pos = low + (target - l[low]) * (high - low) // (l[high] - l[low])
+            if l[pos] == target:
+                return pos
+            if l[pos] < target:
+                low = pos + 1
+            else:
+                high = pos - 1
+        return -1
+
+    def exponential_search(self, l, target):
+        """Double a bound until it passes target, then binary search the last gap."""
+        if not l:
+            return -1
+        bound = 1
+        while bound < len(l) and l[bound] < target:
+            bound *= 2
+        low, high = bound // 2, min(bound, len(l) - 1)
+        while low <= high:
+            midpoint = (low + high) // 2
+            value = l[midpoint]
+            if value == target:
+                return midpoint
+            if target < value:
+                high = midpoint - 1
+            else:
+                low = midpoint + 1
+        return -1
+
+    def numpy_batch_search(self, arr, targets):
+        """Index of every target in the sorted array arr, -1 where missing."""
+        if len(arr) == 0:
+            return np.full(len(targets), -1)
+        idx = np.searchsorted(arr, targets)
+        found = arr[np.minimum(idx, len(arr) - 1)] == targets
+        return np.where(found, idx, -1)
+
+    def eytzinger_index(self, keys):
+        return SortedIndex(keys, layout='eytzinger')
 
-    def run_benchmark(self, min_size=1000, max_size=10000, step=1000):
+    def generate_sorted_array(self, length, seed=None):
+        """Sorted unique int64 keys; seeded datasets are cached on disk and memory-mapped."""
+        return load_sorted_keys(length, seed)
+
+    def generate_sorted_list(self, length, seed=None):
+        return self.generate_sorted_array(length, seed).tolist()
+
+    def run_benchmark(self, min_size=1000, max_size=10000, step=1000, repeat=5, warmup=1,
+                      workload='sequential', seed=None):
+        """Time every engine on one query stream per size; see workloads.WORKLOADS.
+
+        Each size gets as many queries as the list has elements.
+        """
         print(f"\n{Fore.YELLOW}🚀 Running Search Algorithm Benchmark{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Testing from {min_size} to {max_size} elements in steps of {step}{Style.RESET_ALL}\n")
+        print(f"{Fore.CYAN}Testing from {min_size} to {max_size} elements in steps of {step}, "
+              f"{workload} queries, {repeat} timed runs after {warmup} warm-up{Style.RESET_ALL}\n")
+        self.config = {'min_size': min_size, 'max_size': max_size, 'step': step,
+                       'repeat': repeat, 'warmup': warmup, 'workload': workload, 'seed': seed}
+        rng = random.Random(seed)
+        self.records = []
         
         for size in range(min_size, max_size + 1, step):
-            sorted_list = self.generate_sorted_list(size)
+            sorted_list = self.generate_sorted_list(size, seed)
+            queries = WORKLOADS[workload](sorted_list, size, rng)
+            print(f"{self.colors['text']}Size: {size:6d}")
             
-            # Native search benchmark
-            start = time.perf_counter()
-            for target in sorted_list:
-                self.native_search(sorted_list, target)
-            native_time = time.perf_counter() - start
+            for name, search in self.engines.items():
+                keys = self.builders.get(name, list)(sorted_list)
+                def search_all(search=search, keys=keys):
+                    for target in queries:
+                        search(keys, target)
+                self.record(name, measure(search_all, repeat, warmup), size, workload, size)
             
-            # Binary search benchmark
-            start = time.perf_counter()
-            for target in sorted_list:
-                self.binary_search(sorted_list, target)
-            binary_time = time.perf_counter() - start
+            for name, search in self.batch_engines.items():
+                keys = self.builders.get(name, list)(sorted_list)
+                targets = self.batch_inputs[name](queries)
+                self.record(name, measure(lambda: search(keys, targets), repeat, warmup),
+                            size, workload, size)
+
+    def run_index_benchmark(self, sizes=(10**4, 10**5, 10**6, 10**7, 10**8), num_queries=100_000,
+                            repeat=5, warmup=1, seed=0):
+        """Compare the array-backed indexes with list and NumPy engines at sizes where cache misses dominate.
+
+        Every size answers the same number of uniformly drawn hits, so the
+        per-query time shows the cost of memory access rather than of the
+        query count. List-based engines stop at MAX_LIST_SIZE. With a seed
+        (the default) each size's keys are generated once and then loaded
+        from the on-disk cache.
+        """
+        engines = ['bisect', 'iterative', 'index', 'eytzinger']
+        batch_engines = ['numpy', 'index_batch', 'eytzinger_batch']
+        print(f"\n{Fore.YELLOW}🚀 Running Sorted Index Benchmark{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Sizes {', '.join(f'{size:,}' for size in sizes)}, {num_queries:,} queries each, "
+              f"{repeat} timed runs after {warmup} warm-up{Style.RESET_ALL}\n")
+        self.config = {'sizes': list(sizes), 'num_queries': num_queries,
+                       'repeat': repeat, 'warmup': warmup, 'workload': 'uniform', 'seed': seed}
+        rng = np.random.default_rng(seed)
+        self.records = []
+        
+        for size in sizes:
+            keys = self.generate_sorted_array(size, seed)
+            queries = keys[rng.integers(0, size, size=num_queries)]
+            query_list = queries.tolist()
+            print(f"{self.colors['text']}Size: {size:,}")
+            sorted_list = keys.tolist() if size <= MAX_LIST_SIZE else None
             
-            self.results['native'].append(native_time / size)
-            self.results['binary'].append(binary_time / size)
-            self.results['sizes'].append(size)
+            for name in engines:
+                build = self.builders.get(name)
+                if build is None and sorted_list is None:
+                    continue
+                structure = build(keys) if build else sorted_list
+                search = self.engines[name]
+                def search_all(search=search, structure=structure):
+                    for target in query_list:
+                        search(structure, target)
+                self.record(name, measure(search_all, repeat, warmup), size, 'uniform', num_queries)
+                del structure
             
-            print(f"{self.colors['text']}Size: {size:6d} | "
-                  f"{self.colors['native']}Native: {native_time/size:.8f}s | "
-                  f"{self.colors['binary']}Binary: {binary_time/size:.8f}s")
+            del sorted_list
+            for name in batch_engines:
+                structure = self.builders[name](keys)
+                search = self.batch_engines[name]
+                self.record(name, measure(lambda: search(structure, queries), repeat, warmup),
+                            size, 'uniform', num_queries)
+                del structure
+
+    def record(self, name, stats, size, workload, queries):
+        """Print and keep per-query stats for one engine and size; return them."""
+        per_query = scale(stats, queries)
+        queries_per_sec = 1 / per_query['median'] if per_query['median'] else 0.0
+        self.records.append({'engine': name, 'workload': workload, 'size': size,
+                             **per_query, 'queries_per_sec': queries_per_sec})
+        print(f"  {self.colors[name]}{self.labels[name]:>28}: {per_query['median']:.8f}s/query "
+              f"{queries_per_sec:>14,.0f} q/s "
+              f"(IQR {per_query['iqr']:.2e}s, 95% CI {per_query['ci_low']:.8f}-{per_query['ci_high']:.8f}s)")
+        return per_query
 
-    def visualize_results(self):
+    def save_results(self, path):
+        """Write the per-query timing stats to path, as CSV for a .csv path and JSON otherwise."""
+        if path.lower().endswith('.csv'):
+            write_csv(self.records, path)
+        else:
+            write_json(self.records, path, self.config)
+        print(f"{Fore.GREEN}✅ Results written to {path}{Style.RESET_ALL}")
+
+    def visualize_results(self, path='search_benchmark.png', show=True):
+        """Plot the last run's per-query medians with their IQR; show the window only if asked."""
         plt.figure(figsize=(12, 6))
         
-        # Plot Native Search
-        plt.plot(self.results['sizes'], self.results['native'], 
-                'r-', label='Native Search', linewidth=2)
-        
-        # Plot Binary Search
-        plt.plot(self.results['sizes'], self.results['binary'], 
-                'g-', label='Binary Search', linewidth=2)
+        engines = list(dict.fromkeys(r['engine'] for r in self.records))
+        for name in engines:
+            records = [r for r in self.records if r['engine'] == name]
+            sizes = [r['size'] for r in records]
+            plt.plot(sizes, [r['median'] for r in records], 
+                    label=self.labels[name], linewidth=2)
+            # Shade the interquartile range of the timed runs
+            plt.fill_between(sizes, [r['q1'] for r in records],
+                             [r['q3'] for r in records], alpha=0.2)
         
+        sizes = [r['size'] for r in self.records]
+        if sizes and max(sizes) >= 100 * min(sizes):
+            plt.xscale('log')
         plt.xlabel('List Size', fontsize=12)
         plt.ylabel('Time per Search (seconds)', fontsize=12)
+        plt.yscale('log')
         plt.title('Search Algorithm Performance Comparison', fontsize=14)
         plt.legend(fontsize=12)
         plt.grid(True, which='both', linestyle='--', linewidth=0.5)
         plt.tight_layout()
         
-        # Save and show plot
-        plt.savefig('search_benchmark.png', dpi=300)
-        print(f"\n{Fore.GREEN}✅ Benchmark results saved as search_benchmark.png{Style.RESET_ALL}")
-        plt.show()
+        plt.savefig(path, dpi=300)
+        print(f"\n{Fore.GREEN}✅ Benchmark results saved as {path}{Style.RESET_ALL}")
+        if show:
+            plt.show()
+        plt.close()
 
     def run_interactive_demo(self):
         print(f"\n{Fore.YELLOW}🔍 Interactive Search Demo{Style.RESET_ALL}")
@@ -109,6 +316,7 @@ class SearchBenchmark:
         
         sorted_list = self.generate_sorted_list(size)
         print(f"\n{Fore.CYAN}Generated a sorted list of {size} unique integers between {-3*size} and {3*size}{Style.RESET_ALL}")
+        structures = {name: self.builders.get(name, list)(sorted_list) for name in self.engines}
         
         while True:
             target = input(f"\n{Fore.CYAN}Enter number to search (or 'q' to quit): {Style.RESET_ALL}")
@@ -123,19 +331,14 @@ class SearchBenchmark:
                 
             print(f"\n{Fore.MAGENTA}Searching for {target}...{Style.RESET_ALL}")
             
-            # Native search
-            start = time.perf_counter()
-            result = self.native_search(sorted_list, target)
-            native_time = time.perf_counter() - start
-            print(f"{self.colors['native']}Native Search: {'Found' if result != -1 else 'Not found'} at index {result} | Time: {native_time:.8f}s")
+            times = {}
+            for name, search in self.engines.items():
+                start = time.perf_counter()
+                result = search(structures[name], target)
+                times[name] = time.perf_counter() - start
+                print(f"{self.colors[name]}{self.labels[name]}: {'Found' if result != -1 else 'Not found'} at index {result} | Time: {times[name]:.8f}s")
             
-            # Binary search
-            start = time.perf_counter()
-            result = self.binary_search(sorted_list, target)
-            binary_time = time.perf_counter() - start
-            print(f"{self.colors['binary']}Binary Search: {'Found' if result != -1 else 'Not found'} at index {result} | Time: {binary_time:.8f}s")
-            
-            print(f"\n{Fore.CYAN}Binary search was {native_time/binary_time:.1f}x faster!{Style.RESET_ALL}")
+            print(f"\n{Fore.CYAN}Binary search was {times['native']/times['binary']:.1f}x faster!{Style.RESET_ALL}")
 
 if __name__ == '__main__':
     benchmark = SearchBenchmark()
@@ -143,18 +346,38 @@ if __name__ == '__main__':
     print(f"\n{Fore.YELLOW}=== Search Algorithm Benchmark Suite ==={Style.RESET_ALL}")
     print(f"{Fore.CYAN}1. Run full benchmark test")
     print(f"{Fore.CYAN}2. Interactive demo")
-    print(f"{Fore.CYAN}3. Exit{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}3. Sorted index benchmark (large sizes)")
+    print(f"{Fore.CYAN}4. Exit{Style.RESET_ALL}")
     
     while True:
-        choice = input(f"\n{Fore.YELLOW}Enter your choice (1-3): {Style.RESET_ALL}")
+        choice = input(f"\n{Fore.YELLOW}Enter your choice (1-4): {Style.RESET_ALL}")
         
         if choice == '1':
-            benchmark.run_benchmark(min_size=1000, max_size=20000, step=2000)
+            workload = input(f"{Fore.CYAN}Query workload ({', '.join(WORKLOADS)}) [sequential]: "
+                             f"{Style.RESET_ALL}").strip() or 'sequential'
+            if workload not in WORKLOADS:
+                print(f"{Fore.RED}Unknown workload, using sequential{Style.RESET_ALL}")
+                workload = 'sequential'
+            benchmark.run_benchmark(min_size=1000, max_size=20000, step=2000, workload=workload)
             benchmark.visualize_results()
+            path = input(f"{Fore.CYAN}Save results as .json or .csv (Enter to skip): {Style.RESET_ALL}").strip()
+            if path:
+                try:
+                    benchmark.save_results(path)
+                except OSError as e:
+                    print(f"{Fore.RED}Could not save results: {e}{Style.RESET_ALL}")
         elif choice == '2':
             benchmark.run_interactive_demo()
         elif choice == '3':
+            try:
+                largest = int(input(f"{Fore.CYAN}Largest size as a power of ten (4-8): {Style.RESET_ALL}"))
+            except ValueError:
+                largest = 7
+            largest = max(4, min(8, largest))
+            benchmark.run_index_benchmark(sizes=[10**e for e in range(4, largest + 1)])
+            benchmark.visualize_results('index_benchmark.png')
+        elif choice == '4':
             print(f"\n{Fore.YELLOW}👋 Goodbye!{Style.RESET_ALL}")
             sys.exit()
         else:
-            print(f"{Fore.RED}Invalid choice. Please enter 1, 2, or 3.{Style.RESET_ALL}")
\ No newline at end of file
+            print(f"{Fore.RED}Invalid choice. Please enter 1, 2, 3, or 4.{Style.RESET_ALL}")
\ No newline at end of file
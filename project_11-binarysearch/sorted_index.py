@@ -0,0 +1,134 @@
+from array import array
+import numpy as np
+
+INT64_MAX = np.iinfo(np.int64).max
+
+
+class SortedIndex:
+    """Sorted int64 keys in one contiguous array('q') buffer, searched without branches.
+
+    A Python list holds a pointer per key, so every probe of a list-based
+    search chases it to a separate int object. Here the keys sit unboxed
+    and side by side, and a NumPy view over the same buffer answers whole
+    batches of queries at once.
+
+    layout='sorted' keeps the keys in order and runs a branchless lower
+    bound: each step moves the base by `half` times the comparison result
+    instead of taking an if/else.
+
+    layout='eytzinger' stores the keys in breadth-first order of an implicit
+    binary search tree (the children of slot k are 2k and 2k+1), padded
+    with INT64_MAX to a perfect tree. The first levels of every search hit
+    the same few cache lines, and the next probe is always near 2k, so
+    large indexes miss the cache far less than a halving search over
+    sorted keys. Results are still positions in sorted order.
+    """
+
+    def __init__(self, keys, layout='sorted'):
+        if layout not in ('sorted', 'eytzinger'):
+            raise ValueError(f"Unknown layout '{layout}'. Use 'sorted' or 'eytzinger'")
+        self.layout = layout
+        sorted_keys = np.ascontiguousarray(keys, dtype=np.int64)
+        self.size = len(sorted_keys)
+        # The keys are copied once, into self.keys, with no intermediate buffers
+        if layout == 'eytzinger':
+            # A perfect tree of `levels` levels fills slots 1 .. 2**levels - 1
+            self.levels = max(1, self.size.bit_length())
+            self.keys = array('q', [0]) * (1 << self.levels)
+            self.view = np.frombuffer(self.keys, dtype=np.int64)
+            eytzinger_order(sorted_keys, out=self.view)
+        else:
+            self.keys = array('q')
+            self.keys.frombytes(memoryview(sorted_keys).cast('B'))
+            self.view = np.frombuffer(self.keys, dtype=np.int64)
+
+    def __len__(self):
+        return self.size
+
+    def find(self, target):
+        """Position of target in sorted order, or -1."""
+        if self.layout == 'eytzinger':
+            return self._find_eytzinger(target)
+        keys, n = self.keys, self.size
+        if not n:
+            return -1
+        base = 0
+        while n > 1:
+            half = n >> 1
+            base += half * (keys[base + half] < target)
+            n -= half
+        i = base + (keys[base] < target)
+        return i if i < self.size and keys[i] == target else -1
+
+    def find_batch(self, targets):
+        """Positions of every target in sorted order, -1 where missing, as an array."""
+        targets = np.asarray(targets, dtype=np.int64)
+        if not self.size:
+            return np.full(len(targets), -1)
+        if self.layout == 'eytzinger':
+            return self._find_batch_eytzinger(targets)
+        keys = self.view
+        base = np.zeros(len(targets), dtype=np.int64)
+        n = self.size
+        # All queries step in lockstep: one gather and compare per level
+        while n > 1:
+            half = n >> 1
+            base += half * (keys[base + half] < targets)
+            n -= half
+        i = base + (keys[base] < targets)
+        found = keys[np.minimum(i, self.size - 1)] == targets
+        return np.where(found, i, -1)
+
+    def _find_eytzinger(self, target):
+        tree = self.keys
+        k = 1
+        for _ in range(self.levels):
+            k = 2*k + (tree[k] < target)
+        # Undo the final run of right turns and the last left turn: k becomes
+        # the slot of the lower bound, or 0 when target is above every key
+        k >>= (k ^ (k + 1)).bit_length()
+        if not k or tree[k] != target:
+            return -1
+        i = self._sorted_position(k)
+        return i if i < self.size else -1
+
+    def _find_batch_eytzinger(self, targets):
+        tree = self.view
+        k = np.ones(len(targets), dtype=np.int64)
+        for _ in range(self.levels):
+            k = 2*k + (tree[k] < targets)
+        # frexp's exponent of the lowest clear bit is the shift that undoes the trailing right turns
+        k >>= np.frexp(~k & (k + 1))[1]
+        depth = np.frexp(k)[1] - 1
+        offset = k - (np.int64(1) << np.maximum(depth, 0))
+        positions = ((2*offset + 1) << (self.levels - 1 - depth)) - 1
+        found = (k > 0) & (tree[k] == targets) & (positions < self.size)
+        return np.where(found, positions, -1)
+
+    def _sorted_position(self, k):
+        """In-order position of tree slot k (1-based) in the perfect tree."""
+        depth = k.bit_length() - 1
+        offset = k - (1 << depth)
+        return ((2*offset + 1) << (self.levels - 1 - depth)) - 1
+
+
+def eytzinger_order(sorted_keys, out=None):
+    """Sorted keys -> breadth-first tree array of length 2**levels (slot 0 unused).
+
+    The tree is padded to a perfect one with INT64_MAX. The in-order
+    positions of one level's slots form an arithmetic sequence, so each
+    level is a single strided slice of the sorted keys and no index arrays
+    or padded copy are built. Pass `out` to fill an existing int64 buffer
+    of the right length instead of allocating one.
+    """
+    levels = max(1, len(sorted_keys).bit_length())
+    if out is None:
+        out = np.empty(1 << levels, dtype=np.int64)
+    tree = out
+    tree.fill(INT64_MAX)
+    for depth in range(levels):
+        # Slot 2**depth + offset holds position (2*offset + 1) * 2**(levels-1-depth) - 1
+        step = 1 << (levels - depth)
+        level = sorted_keys[(step >> 1) - 1::step]
+        tree[1 << depth:(1 << depth) + len(level)] = level
+    return tree
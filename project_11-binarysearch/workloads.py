@@ -0,0 +1,81 @@
+import random
+from bisect import bisect_left
+from itertools import accumulate
+
+# Share of misses in the miss-heavy stream
+MISS_RATIO = 0.9
+# Zipf exponent: the key ranked r is looked up in proportion to 1 / r**ZIPF_S
+ZIPF_S = 1.1
+# Queries per sorted batch in the sorted-batch stream
+BATCH_SIZE = 1000
+
+
+def sequential(keys, count, rng=random):
+    """Every key once, in sorted order; the stream run_benchmark has always used."""
+    return list(keys[:count])
+
+
+def uniform(keys, count, rng=random):
+    """Every key equally likely, all hits."""
+    return rng.choices(keys, k=count)
+
+
+def zipf(keys, count, rng=random):
+    """A few hot keys take most lookups, like a cache-friendly production stream."""
+    ranked = list(keys)
+    rng.shuffle(ranked)  # Hot keys sit anywhere in the sorted order
+    cum_weights = list(accumulate(1 / rank ** ZIPF_S for rank in range(1, len(ranked) + 1)))
+    return rng.choices(ranked, cum_weights=cum_weights, k=count)
+
+
+def miss_heavy(keys, count, rng=random):
+    """Mostly values that are not in keys, spread over the same range."""
+    if not keys:
+        return [rng.randint(-3, 3) for _ in range(count)]
+    present = set(keys)
+    low, high = keys[0] - 1, keys[-1] + 1
+    queries = []
+    for _ in range(count):
+        if rng.random() >= MISS_RATIO:
+            queries.append(rng.choice(keys))
+            continue
+        value = rng.randint(low, high)
+        while value in present:
+            value = rng.randint(low, high)
+        queries.append(value)
+    return queries
+
+
+def sorted_batch(keys, count, rng=random):
+    """Uniform hits arriving in sorted batches of BATCH_SIZE, as from a sorted join input."""
+    queries = uniform(keys, count, rng)
+    return [q for start in range(0, count, BATCH_SIZE) for q in sorted(queries[start:start + BATCH_SIZE])]
+
+
+WORKLOADS = {
+    'sequential': sequential,
+    'uniform': uniform,
+    'zipf': zipf,
+    'miss_heavy': miss_heavy,
+    'sorted_batch': sorted_batch,
+}
+
+
+def merge_lookup(keys, targets):
+    """Index of each target in sorted keys, -1 where missing, in one forward pass.
+
+    Targets are visited in sorted order and every search starts where the
+    previous one ended, so a sorted batch of K queries walks keys once like
+    a merge instead of starting K searches from scratch. Results come back
+    in the order targets were given.
+    """
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+    results = [-1] * len(targets)
+    n = len(keys)
+    i = 0
+    for j in order:
+        target = targets[j]
+        i = bisect_left(keys, target, i)
+        if i < n and keys[i] == target:
+            results[j] = i
+    return results
@@ -1,45 +1,104 @@
 import random
 import re
+import sys
+import numpy as np
 from colorama import Fore, Style, init
-import os
 import time
 
 # Initialize colorama
 init(autoreset=True)
 
+# Cell values in Board.board: 0-8 neighbouring bombs, or BOMB
+BOMB = 9
+# Board.state codes beyond the cell values, for cells not dug yet
+FLAGGED = 10
+HIDDEN = 11
+NUMBER_COLORS = [Fore.BLUE, Fore.GREEN, Fore.RED, Fore.MAGENTA,
+                 Fore.YELLOW, Fore.CYAN, Fore.BLACK, Fore.WHITE]
+# Colored glyph per state code, built once instead of per cell per frame
+GLYPHS = (
+    [' '] +
+    [color + str(value) + Style.RESET_ALL for value, color in enumerate(NUMBER_COLORS, 1)] +
+    [Fore.RED + '💣' + Style.RESET_ALL, Fore.YELLOW + '⚑' + Style.RESET_ALL, Fore.WHITE + '■' + Style.RESET_ALL]
+)
+CLEAR = "\033[H\033[2J"
+# bytes.translate table: 0 for cells with no neighbouring bombs, 1 otherwise
+ZERO_MAP = bytes([0] + [1] * 255)
+MAX_DIM_SIZE = 1000
+# Preset (dim_size, num_bombs) per difficulty
+DIFFICULTIES = {
+    'easy': (8, 10),
+    'medium': (10, 20),
+    'hard': (12, 40),
+}
+
 class Board:
-    def __init__(self, dim_size, num_bombs):
+    def __init__(self, dim_size, num_bombs, rng=random, safe_first_click=False):
+        """Pass a seeded random.Random as rng to reproduce a board exactly.
+
+        With safe_first_click, bombs are only placed on the first dig, away
+        from the dug cell and its neighbours, so it always opens a region.
+        """
         self.dim_size = dim_size
         self.num_bombs = num_bombs
-        self.board = self.make_new_board()
-        self.assign_values_to_board()
-        self.dug = set()
+        self.rng = rng
+        # Flat row-major arrays: cell (row, col) is at row * dim_size + col
+        self.board = bytearray(dim_size * dim_size)
+        self.bombs_placed = not safe_first_click
+        if self.bombs_placed:
+            self.board = self.make_new_board()
+            self.assign_values_to_board()
+        self.revealed = bytearray(dim_size * dim_size)
+        self.num_dug = 0
         self.flags = set()
         self.game_over = False
+        # Set to a list by BoardRenderer to collect the (start, stop) flat
+        # cell ranges each dig or flag touches
+        self.changes = None
 
-    def make_new_board(self):
-        board = [[None for _ in range(self.dim_size)] for _ in range(self.dim_size)]
-        bombs_planted = 0
-        
-        while bombs_planted < self.num_bombs:
-            loc = random.randint(0, self.dim_size**2 - 1)
-            row = loc // self.dim_size
-            col = loc % self.dim_size
+    def make_new_board(self, exclude=()):
+        """Plant num_bombs bombs on distinct cells, none of them in exclude.
 
-            if board[row][col] == '*':
-                continue
+        Cells are drawn without replacement from the flat index range with
+        the excluded cells left out, so there are no retries and nearly full
+        boards cost no more than nearly empty ones.
+        """
+        total = self.dim_size ** 2
+        exclude = sorted(exclude)
+        allowed = total - len(exclude)
+        # On boards more than half bombs, sample the safe cells instead
+        dense = self.num_bombs > allowed // 2
+        picks = np.array(self.rng.sample(range(allowed), allowed - self.num_bombs if dense else self.num_bombs),
+                         dtype=np.int64)
+        # Map the k-th allowed cell back to its index by stepping over excluded ones
+        for skipped in exclude:
+            picks[picks >= skipped] += 1
+        cells = np.full(total, BOMB if dense else 0, dtype=np.uint8)
+        cells[picks] = 0 if dense else BOMB
+        cells[exclude] = 0
+        return bytearray(cells.tobytes())
 
-            board[row][col] = '*'
-            bombs_planted += 1
-
-        return board
+    def place_bombs_around(self, row, col):
+        """Place the bombs for a first dig at (row, col): a zero when there is room, else just safe."""
+        n = self.dim_size
+        around = [r*n + c
+                  for r in range(max(0, row-1), min(n-1, row+1)+1)
+                  for c in range(max(0, col-1), min(n-1, col+1)+1)]
+        if self.num_bombs > n * n - len(around):
+            around = [row*n + col]
+        self.board = self.make_new_board(around)
+        self.assign_values_to_board()
+        self.bombs_placed = True
 
     def assign_values_to_board(self):
-        for r in range(self.dim_size):
-            for c in range(self.dim_size):
-                if self.board[r][c] == '*':
-                    continue
-                self.board[r][c] = self.get_num_neighboring_bombs(r, c)
+        # Count every cell's neighbours at once by summing the 8 shifted copies
+        # of a zero-padded bomb grid
+        n = self.dim_size
+        bombs = np.frombuffer(self.board, dtype=np.uint8).reshape(n, n) == BOMB
+        padded = np.pad(bombs.astype(np.uint8), 1)
+        counts = sum(padded[1+dr:1+dr+n, 1+dc:1+dc+n]
+                     for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+        self.board[:] = np.where(bombs, BOMB, counts).astype(np.uint8).tobytes()
 
     def get_num_neighboring_bombs(self, row, col):
         num_neighboring_bombs = 0
@@ -47,92 +106,213 @@ class Board:
             for c in range(max(0, col-1), min(self.dim_size-1, col+1)+1):
                 if r == row and c == col:
                     continue
-                if self.board[r][c] == '*':
+                if self.board[r*self.dim_size + c] == BOMB:
                     num_neighboring_bombs += 1
         return num_neighboring_bombs
 
+    def value(self, row, col):
+        return self.board[row*self.dim_size + col]
+
+    def is_dug(self, row, col):
+        return self.revealed[row*self.dim_size + col] == 1
+
+    @property
+    def dug(self):
+        """Dug cells as a set of (row, col); use num_dug or is_dug on hot paths."""
+        n = self.dim_size
+        return {(i // n, i % n) for i, seen in enumerate(self.revealed) if seen}
+
+    def state(self, i):
+        """What a player sees at flat index i: the cell value once dug, else FLAGGED or HIDDEN."""
+        if self.revealed[i]:
+            return self.board[i]
+        return FLAGGED if divmod(i, self.dim_size) in self.flags else HIDDEN
+
     def dig(self, row, col):
         if (row, col) in self.flags:
             return True
-            
-        self.dug.add((row, col))
-        
-        if self.board[row][col] == '*':
+        if not self.bombs_placed:
+            self.place_bombs_around(row, col)
+
+        n = self.dim_size
+        board, revealed = self.board, self.revealed
+        start = row*n + col
+        if board[start] == BOMB:
+            if not revealed[start]:
+                revealed[start] = 1
+                self.num_dug += 1
+                self._changed(start, start + 1)
             self.game_over = True
             return False
-        elif self.board[row][col] > 0:
+
+        if revealed[start]:
             return True
 
-        for r in range(max(0, row-1), min(self.dim_size-1, row+1)+1):
-            for c in range(max(0, col-1), min(self.dim_size-1, col+1)+1):
-                if (r, c) in self.dug:
+        revealed[start] = 1
+        self.num_dug += 1
+        self._changed(start, start + 1)
+        if board[start]:
+            return True
+
+        # Scanline flood fill: each stack entry seeds a whole horizontal run of
+        # zeros, which is revealed along with its border in the rows above and
+        # below using bytearray find and slice operations instead of per-cell
+        # steps. Runs of zeros touching that border are pushed as new seeds.
+        # Flagged cells block the flood like numbered cells and stay hidden.
+        blocked = board.translate(ZERO_MAP)
+        for r, c in self.flags:
+            blocked[r*n + c] = 1
+        spread = bytearray(n * n)
+        stack = [start]
+        dug = 0
+        while stack:
+            i = stack.pop()
+            if spread[i]:
+                continue
+            row_start = i - i % n
+            row_end = row_start + n
+            lo = max(row_start, blocked.rfind(1, row_start, i) + 1)
+            hi = blocked.find(1, i, row_end)
+            if hi == -1:
+                hi = row_end
+            spread[lo:hi] = b'\x01' * (hi - lo)
+            lo = max(row_start, lo - 1)
+            hi = min(row_end, hi + 1)
+            for offset in (-n, 0, n):
+                a, b = lo + offset, hi + offset
+                if a < 0 or b > n * n:
                     continue
-                self.dig(r, c)
+                dug += revealed.count(0, a, b)
+                revealed[a:b] = b'\x01' * (b - a)
+                self._changed(a, b)
+                if offset:
+                    j = blocked.find(0, a, b)
+                    while j != -1:
+                        if not spread[j]:
+                            stack.append(j)
+                        j = blocked.find(1, j, b)
+                        if j == -1:
+                            break
+                        j = blocked.find(0, j, b)
+        for r, c in self.flags:
+            if revealed[r*n + c]:
+                revealed[r*n + c] = 0
+                dug -= 1
+        self.num_dug += dug
         return True
 
     def toggle_flag(self, row, col):
-        if (row, col) in self.dug:
+        if self.is_dug(row, col):
             return False
         if (row, col) in self.flags:
             self.flags.remove((row, col))
         else:
             self.flags.add((row, col))
+        i = row*self.dim_size + col
+        self._changed(i, i + 1)
         return True
 
+    def _changed(self, start, stop):
+        if self.changes is not None:
+            self.changes.append((start, stop))
+
     def __str__(self):
-        visible_board = [[None for _ in range(self.dim_size)] for _ in range(self.dim_size)]
-        
-        for row in range(self.dim_size):
-            for col in range(self.dim_size):
-                if (row, col) in self.dug:
-                    cell_value = self.board[row][col]
-                    if cell_value == '*':
-                        visible_board[row][col] = Fore.RED + '💣' + Style.RESET_ALL
-                    elif cell_value == 0:
-                        visible_board[row][col] = ' '
-                    else:
-                        colors = [Fore.BLUE, Fore.GREEN, Fore.RED, Fore.MAGENTA, 
-                                 Fore.YELLOW, Fore.CYAN, Fore.BLACK, Fore.WHITE]
-                        visible_board[row][col] = colors[cell_value-1] + str(cell_value) + Style.RESET_ALL
-                elif (row, col) in self.flags:
-                    visible_board[row][col] = Fore.YELLOW + '⚑' + Style.RESET_ALL
-                else:
-                    visible_board[row][col] = Fore.WHITE + '■' + Style.RESET_ALL
+        n = self.dim_size
+        width = len(str(n - 1))
+        flagged = {r*n + c for r, c in self.flags}
+        revealed, board = self.revealed, self.board
 
         # Build the board string
-        board_str = "\n"
-        board_str += "    " + "   ".join([f"{col}" for col in range(self.dim_size)]) + "\n"
-        board_str += "  ╔" + "═══╦" * (self.dim_size-1) + "═══╗\n"
-        
-        for i, row in enumerate(visible_board):
-            row_str = f"{i} ║"
-            for cell in row:
-                row_str += f" {cell} ║"
-            board_str += row_str + "\n"
-            if i < self.dim_size - 1:
-                board_str += "  ╠" + "═══╬" * (self.dim_size-1) + "═══╣\n"
-        
-        board_str += "  ╚" + "═══╩" * (self.dim_size-1) + "═══╝\n"
-        return board_str
+        lines = [""]
+        lines.append(" " * (width + 3) + "".join(f"{col:<4}" for col in range(n)).rstrip())
+        lines.append(" " * width + " ╔" + "═══╦" * (n-1) + "═══╗")
+        separator = " " * width + " ╠" + "═══╬" * (n-1) + "═══╣"
+        for row in range(n):
+            cells = []
+            for i in range(row*n, row*n + n):
+                state = board[i] if revealed[i] else FLAGGED if i in flagged else HIDDEN
+                cells.append(f" {GLYPHS[state]} ║")
+            lines.append(f"{row:>{width}} ║" + "".join(cells))
+            if row < n - 1:
+                lines.append(separator)
+        lines.append(" " * width + " ╚" + "═══╩" * (n-1) + "═══╝")
+        return "\n".join(lines) + "\n"
+
+
+class BoardRenderer:
+    """Draws a Board in the terminal, then redraws only the cells that change.
+
+    The first frame is written in full. After that the board reports which
+    cell ranges each dig or flag touched, and only cells whose glyph differs
+    from the one on screen are rewritten, in place, with ANSI cursor
+    positioning. A move costs time in proportion to what it changed, not to
+    the board size.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        board.changes = []
+        self.shown = None
+        self.width = len(str(board.dim_size - 1))
+
+    def draw(self, header, status):
+        """Draw the frame and leave the cursor on the line below it, cleared."""
+        board = self.board
+        n = board.dim_size
+        if self.shown is None:
+            self.shown = bytearray(board.state(i) for i in range(n * n))
+            board.changes.clear()
+            top = header + "\n\n" + status + Style.RESET_ALL + "\n"
+            frame = top + str(board) + "\n"
+            # Screen rows are 1-based; board rows sit below the blank line,
+            # column labels and top border, with a separator between rows
+            self.status_row = top.count("\n")
+            self.first_cell_row = self.status_row + 4
+            self.prompt_row = frame.count("\n") + 1
+            sys.stdout.write(CLEAR + frame)
+            sys.stdout.flush()
+            return
+
+        shown = self.shown
+        out = []
+        for start, stop in board.changes:
+            for i in range(start, stop):
+                state = board.state(i)
+                if state == shown[i]:
+                    continue
+                shown[i] = state
+                row, col = divmod(i, n)
+                out.append(f"\033[{self.first_cell_row + 2*row};{self.width + 4 + 4*col}H{GLYPHS[state]}")
+        board.changes.clear()
+        out.append(f"\033[{self.status_row};1H{status}{Style.RESET_ALL}\033[K")
+        out.append(f"\033[{self.prompt_row};1H\033[J")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    print(CLEAR, end="")
 
-def print_intro():
-    print(Fore.CYAN + r"""
+def intro_text():
+    return "\n".join([
+        Fore.CYAN + r"""
   __  __ _                            
  |  \/  (_)_ __   ___  ___ _ __ ___  
  | |\/| | | '_ \ / _ \/ __| '_ ` _ \ 
  | |  | | | | | |  __/\__ \ | | | | |
  |_|  |_|_|_| |_|\___||___/_| |_| |_|
-    """)
-    print(Fore.YELLOW + "Welcome to Minesweeper!")
-    print(Fore.GREEN + "="*50)
-    print(Fore.WHITE + "Instructions:")
-    print("- Enter coordinates as row,col (e.g. 2,3)")
-    print("- Type 'f' before coordinates to place/remove flag (e.g. f2,3)")
-    print("- Flag all bombs to win or uncover all safe squares")
-    print(Fore.GREEN + "="*50)
+    """ + Style.RESET_ALL,
+        Fore.YELLOW + "Welcome to Minesweeper!" + Style.RESET_ALL,
+        Fore.GREEN + "="*50 + Style.RESET_ALL,
+        Fore.WHITE + "Instructions:" + Style.RESET_ALL,
+        "- Enter coordinates as row,col (e.g. 2,3)",
+        "- Type 'f' before coordinates to place/remove flag (e.g. f2,3)",
+        "- Flag all bombs to win or uncover all safe squares",
+        Fore.GREEN + "="*50 + Style.RESET_ALL,
+    ])
+
+def print_intro():
+    print(intro_text())
 
 def play():
     clear_screen()
@@ -143,17 +323,17 @@ def play():
         try:
             difficulty = input(Fore.CYAN + "\nSelect difficulty (1-Easy, 2-Medium, 3-Hard, 4-Custom): ")
             if difficulty == '1':
-                dim_size, num_bombs = 8, 10
+                dim_size, num_bombs = DIFFICULTIES['easy']
                 break
             elif difficulty == '2':
-                dim_size, num_bombs = 10, 20
+                dim_size, num_bombs = DIFFICULTIES['medium']
                 break
             elif difficulty == '3':
-                dim_size, num_bombs = 12, 40
+                dim_size, num_bombs = DIFFICULTIES['hard']
                 break
             elif difficulty == '4':
-                dim_size = int(input("Enter board size (5-15): "))
-                dim_size = max(5, min(15, dim_size))
+                dim_size = int(input(f"Enter board size (5-{MAX_DIM_SIZE}): "))
+                dim_size = max(5, min(MAX_DIM_SIZE, dim_size))
                 max_bombs = dim_size**2 - 1
                 num_bombs = int(input(f"Enter number of bombs (1-{max_bombs}): "))
                 num_bombs = max(1, min(max_bombs, num_bombs))
@@ -163,16 +343,15 @@ def play():
         except ValueError:
             print(Fore.RED + "Please enter a valid number")
 
-    board = Board(dim_size, num_bombs)
+    board = Board(dim_size, num_bombs, safe_first_click=True)
+    renderer = BoardRenderer(board)
+    header = intro_text()
     start_time = time.time()
     
     while True:
-        clear_screen()
-        print_intro()
-        print(Fore.MAGENTA + f"\nBoard: {dim_size}x{dim_size} | Bombs: {num_bombs} | Flags: {len(board.flags)}/{num_bombs}")
-        print(board)
+        renderer.draw(header, Fore.MAGENTA + f"Board: {dim_size}x{dim_size} | Bombs: {num_bombs} | Flags: {len(board.flags)}/{num_bombs}")
         
-        if board.game_over or len(board.dug) == board.dim_size ** 2 - num_bombs:
+        if board.game_over or board.num_dug == board.dim_size ** 2 - num_bombs:
             break
             
         user_input = input("\nEnter your move (row,col or frow,col): ").strip().lower()
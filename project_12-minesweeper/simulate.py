@@ -0,0 +1,276 @@
+import argparse
+import importlib
+import os
+import random
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from colorama import Fore, Style
+from main import DIFFICULTIES, FLAGGED, HIDDEN, Board
+from solver import MinesweeperSolver
+
+
+class HeadlessGame:
+    """A Board driven through plain method calls, with no input() or screen output.
+
+    dig and flag take the same (row, col) as the interactive game. The
+    board itself stays private: strategies are handed the game and see only
+    what a player would, through dim_size, num_bombs, num_dug, game_over,
+    state(i) and snapshot().
+
+    Every dig is timed, so the cost of revealing cells can be compared
+    across board engine changes. Placing the bombs is timed on its own in
+    placement_time, whether it happens here or, with safe_first_click, on
+    the first dig.
+    """
+
+    def __init__(self, dim_size, num_bombs, rng=random, safe_first_click=False):
+        start = time.perf_counter()
+        self._board = Board(dim_size, num_bombs, rng, safe_first_click)
+        self.placement_time = time.perf_counter() - start
+        self.dig_times = []
+
+    def dig(self, row, col):
+        """Dig a cell; return False if it was a bomb."""
+        board = self._board
+        if not board.bombs_placed and (row, col) not in board.flags:
+            start = time.perf_counter()
+            board.place_bombs_around(row, col)
+            self.placement_time += time.perf_counter() - start
+        start = time.perf_counter()
+        safe = board.dig(row, col)
+        self.dig_times.append(time.perf_counter() - start)
+        return safe
+
+    def flag(self, row, col):
+        """Toggle a flag; return False if the cell is already dug."""
+        return self._board.toggle_flag(row, col)
+
+    @property
+    def dim_size(self):
+        return self._board.dim_size
+
+    @property
+    def num_bombs(self):
+        return self._board.num_bombs
+
+    @property
+    def num_dug(self):
+        return self._board.num_dug
+
+    @property
+    def game_over(self):
+        """True once a bomb has been dug."""
+        return self._board.game_over
+
+    def state(self, i):
+        """Board.state of flat index i: the cell value once dug, else FLAGGED or HIDDEN."""
+        return self._board.state(i)
+
+    @property
+    def won(self):
+        board = self._board
+        return not board.game_over and board.num_dug == board.dim_size ** 2 - board.num_bombs
+
+    @property
+    def over(self):
+        return self._board.game_over or self.won
+
+    def snapshot(self):
+        """What a player can see right now.
+
+        'cells' holds one Board.state code per cell in row-major order:
+        the cell value once dug, else FLAGGED or HIDDEN.
+        """
+        board = self._board
+        n = board.dim_size
+        revealed = np.frombuffer(board.revealed, dtype=np.uint8).astype(bool)
+        cells = np.where(revealed, np.frombuffer(board.board, dtype=np.uint8), HIDDEN).astype(np.uint8)
+        for r, c in board.flags:
+            cells[r*n + c] = FLAGGED
+        return {
+            'dim_size': n,
+            'num_bombs': board.num_bombs,
+            'cells': cells.tobytes(),
+            'num_dug': board.num_dug,
+            'flags': len(board.flags),
+            'over': self.over,
+            'won': self.won,
+        }
+
+
+class RandomStrategy:
+    """Digs a random hidden, unflagged cell every move. A baseline for other strategies."""
+
+    def __init__(self, game, rng=random):
+        self.game = game
+        self.rng = rng
+
+    def next_move(self):
+        game = self.game
+        if game.over:
+            return None
+        n = game.dim_size
+        while True:
+            i = self.rng.randrange(n * n)
+            if game.state(i) == HIDDEN:
+                return ('dig', *divmod(i, n))
+
+
+# A strategy is built with the HeadlessGame it plays, never the Board behind
+# it, and returns ('dig' or 'flag', row, col) from next_move(), or None once
+# the game is over
+STRATEGIES = {
+    'solver': MinesweeperSolver,
+    'random': RandomStrategy,
+}
+
+
+def resolve_strategy(name):
+    """Look up a built-in strategy name or a 'module:ClassName' path."""
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module_name, _, class_name = name.partition(':')
+    if not class_name:
+        raise ValueError(f"Unknown strategy '{name}'. Use one of {sorted(STRATEGIES)} or module:ClassName")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def parse_config(text):
+    """A difficulty preset name or SIZExBOMBS (e.g. 30x150) -> (dim_size, num_bombs)."""
+    if text in DIFFICULTIES:
+        return DIFFICULTIES[text]
+    size, _, bombs = text.partition('x')
+    try:
+        dim_size, num_bombs = int(size), int(bombs)
+    except ValueError:
+        raise ValueError(f"Unknown config '{text}'. Use one of {sorted(DIFFICULTIES)} or SIZExBOMBS")
+    if dim_size < 2 or not 0 < num_bombs < dim_size ** 2:
+        raise ValueError(f"Config '{text}' needs a size of at least 2 and 1 to size*size-1 bombs")
+    return dim_size, num_bombs
+
+
+def play_headless(game, strategy):
+    """Let strategy play game to the end; return True on a win."""
+    while True:
+        move = strategy.next_move()
+        if move is None:
+            return game.won
+        action, row, col = move
+        if action == 'flag':
+            game.flag(row, col)
+        elif not game.dig(row, col):
+            return False
+
+
+def run_batch(job):
+    """Play a block of games in one worker; return (wins, [seconds per dig], [seconds placing bombs])."""
+    strategy_name, dim_size, num_bombs, first_game, num_games, safe_first_click, seed = job
+    # Each block gets its own seed so results reproduce whatever the worker count
+    rng = random.Random(None if seed is None else seed + first_game)
+    strategy_class = resolve_strategy(strategy_name)
+
+    wins = 0
+    dig_times = []
+    placement_times = []
+    for _ in range(num_games):
+        game = HeadlessGame(dim_size, num_bombs, rng, safe_first_click)
+        wins += play_headless(game, strategy_class(game))
+        dig_times.extend(game.dig_times)
+        placement_times.append(game.placement_time)
+    return wins, dig_times, placement_times
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_simulation(strategy_name, dim_size, num_bombs, num_games=1000, workers=None,
+                   batch_size=100, safe_first_click=False, seed=None):
+    """Play num_games games of one board config over a process pool."""
+    jobs = [(strategy_name, dim_size, num_bombs, first, min(batch_size, num_games - first),
+             safe_first_click, seed)
+            for first in range(0, num_games, batch_size)]
+
+    wins = 0
+    dig_times = []
+    placement_times = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch_wins, batch_times, batch_placements in pool.map(run_batch, jobs):
+            wins += batch_wins
+            dig_times.extend(batch_times)
+            placement_times.extend(batch_placements)
+    elapsed = time.perf_counter() - start
+
+    dig_times.sort()
+    placement_times.sort()
+    return {
+        'strategy': strategy_name,
+        'dim_size': dim_size,
+        'num_bombs': num_bombs,
+        'games': num_games,
+        'wins': wins,
+        'win_rate': wins / num_games if num_games else 0.0,
+        'seconds': elapsed,
+        'games_per_sec': num_games / elapsed if elapsed else 0.0,
+        'digs': len(dig_times),
+        'reveal': {
+            **{f'p{p}': percentile(dig_times, p) for p in (50, 90, 99)},
+            'max': dig_times[-1] if dig_times else 0.0,
+        },
+        'placement': {
+            **{f'p{p}': percentile(placement_times, p) for p in (50, 90, 99)},
+            'max': placement_times[-1] if placement_times else 0.0,
+        },
+    }
+
+
+def print_report(results):
+    print(Fore.GREEN + "\n" + "="*50)
+    print(Fore.YELLOW + f"  {results['strategy']} on {results['dim_size']}x{results['dim_size']}, "
+          f"{results['num_bombs']} bombs - {results['games']} games")
+    print(Fore.GREEN + "="*50)
+    print(Fore.GREEN + f"Won {results['wins']}/{results['games']} ({results['win_rate']:.1%})")
+    print(Fore.CYAN + f"{results['games_per_sec']:.1f} games/sec ({results['seconds']:.2f}s total)")
+    reveal = results['reveal']
+    print(Fore.MAGENTA + f"\nReveal cost over {results['digs']} digs (us):     p50       p90       p99       max")
+    print(Fore.WHITE + " " * 32 + " ".join(
+        f"{reveal[p] * 1e6:9.1f}" for p in ('p50', 'p90', 'p99', 'max')))
+    placement = results['placement']
+    print(Fore.MAGENTA + "Bomb placement per game (us):" + " " * 3 + " ".join(
+        f"{placement[p] * 1e6:9.1f}" for p in ('p50', 'p90', 'p99', 'max')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate headless Minesweeper games over a process pool")
+    parser.add_argument('configs', nargs='*', default=list(DIFFICULTIES),
+                        help="difficulty presets or SIZExBOMBS, e.g. easy 30x150 (default: all presets)")
+    parser.add_argument('-s', '--strategy', default='solver', help="solver, random or module:ClassName")
+    parser.add_argument('-n', '--games', type=int, default=1000, help="games per config")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--safe-first-click', action='store_true', help="first dig always opens a region")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    # Fail fast on bad names before starting the pool
+    try:
+        resolve_strategy(args.strategy)
+        configs = [parse_config(text) for text in args.configs]
+    except (ValueError, ImportError, AttributeError) as e:
+        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    for dim_size, num_bombs in configs:
+        results = run_simulation(args.strategy, dim_size, num_bombs, args.games, args.workers,
+                                 args.batch_size, args.safe_first_click, args.seed)
+        print_report(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+import argparse
+import math
+import random
+import sys
+import time
+from functools import lru_cache
+from colorama import Fore, Style
+from main import DIFFICULTIES, FLAGGED, HIDDEN, Board
+
+# Frontier components bigger than this are not enumerated; their cells fall
+# back to the local estimate of the constraints they appear in
+MAX_COMPONENT = 48
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(n):
+    """Flat neighbour indices of every cell on an n x n board."""
+    table = []
+    for i in range(n * n):
+        r, c = divmod(i, n)
+        table.append(tuple(nr*n + nc
+                           for nr in range(max(0, r-1), min(n-1, r+1)+1)
+                           for nc in range(max(0, c-1), min(n-1, c+1)+1)
+                           if nr != r or nc != c))
+    return tuple(table)
+
+
+class MinesweeperSolver:
+    """Plays a game using only what a player sees: dug cells, their numbers and flags.
+
+    The game is read only through dim_size, num_bombs, num_dug, game_over
+    and state(i), which a Board and a simulate.HeadlessGame both provide.
+
+    Every revealed number gives a constraint: its hidden, unflagged neighbours
+    hold exactly (number - flagged neighbours) mines. Single constraints that
+    are all-safe or all-mines are applied first, then pairs where one
+    constraint's cells are a subset of another's. When nothing is certain,
+    the frontier is split into independent components, each component's
+    mine layouts are enumerated, and the layouts are weighted by how many
+    ways the remaining mines fit in the unconstrained cells. That gives the
+    exact mine probability of every hidden cell, and the safest one is dug.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.n = game.dim_size
+        self.neighbors = neighbor_table(self.n)
+        self.pending = []
+        self.guesses = 0
+
+    def next_move(self):
+        """('dig' or 'flag', row, col) for the next move, or None once the game is over."""
+        game = self.game
+        if game.game_over or game.num_dug == self.n ** 2 - game.num_bombs:
+            return None
+        while True:
+            while self.pending:
+                action, i = self.pending.pop()
+                state = game.state(i)
+                # Codes below FLAGGED are dug cells
+                if state < FLAGGED or (action == 'flag' and state == FLAGGED):
+                    continue  # Already done by an earlier move or the flood fill
+                return action, *divmod(i, self.n)
+            self._plan()
+
+    def _plan(self):
+        cells = [self.game.state(i) for i in range(self.n ** 2)]
+        flagged = {i for i, state in enumerate(cells) if state == FLAGGED}
+        constraints = self._constraints(cells, flagged)
+        safe, mines = self._deduce(constraints)
+        if not safe and not mines:
+            probabilities, interior = self._probabilities(constraints, flagged)
+            safe = {i for i, p in probabilities.items() if p == 0}
+            mines = {i for i, p in probabilities.items() if p == 1}
+            if not safe and not mines:
+                self.guesses += 1
+                safe = {self._safest(probabilities, interior, cells)}
+        # pending is a stack: digs go first, flags after
+        self.pending = [('flag', i) for i in mines] + [('dig', i) for i in sorted(safe, reverse=True)]
+
+    def _constraints(self, cells, flagged):
+        """(hidden unflagged neighbours, mines among them) for each revealed number."""
+        neighbors = self.neighbors
+        constraints = {}
+        for i, mines in enumerate(cells):
+            if not mines or mines >= FLAGGED:
+                continue
+            unknown = []
+            for j in neighbors[i]:
+                if cells[j] < FLAGGED:
+                    continue
+                if j in flagged:
+                    mines -= 1
+                else:
+                    unknown.append(j)
+            if unknown:
+                constraints[frozenset(unknown)] = mines
+        return list(constraints.items())
+
+    def _deduce(self, constraints):
+        """Cells proven safe or mined by single constraints, then by subset pairs."""
+        safe, mines = set(), set()
+        for cells, count in constraints:
+            if count == 0:
+                safe |= cells
+            elif count == len(cells):
+                mines |= cells
+        if safe or mines:
+            return safe, mines
+
+        by_cell = {}
+        for k, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(k)
+        for cells, count in constraints:
+            # Any superset shares every cell, so the first cell's list has them all
+            for k in by_cell[next(iter(cells))]:
+                other, other_count = constraints[k]
+                if len(other) <= len(cells) or not cells < other:
+                    continue
+                rest, rest_count = other - cells, other_count - count
+                if rest_count == 0:
+                    safe |= rest
+                elif rest_count == len(rest):
+                    mines |= rest
+        return safe, mines
+
+    def _probabilities(self, constraints, flagged):
+        """Exact mine probability for each frontier cell, and for any other hidden cell."""
+        game = self.game
+        mines_left = game.num_bombs - len(flagged)
+        hidden = self.n ** 2 - game.num_dug - len(flagged)
+        probabilities = {}
+        distributions = []
+        for cells, component in self._components(constraints):
+            if len(cells) > MAX_COMPONENT:
+                # Too many layouts to count: take each cell's densest constraint
+                for cell in cells:
+                    probabilities[cell] = max(count / len(c) for c, count in component if cell in c)
+                estimate = round(sum(probabilities[cell] for cell in cells))
+                mines_left -= estimate
+                hidden -= len(cells)
+                continue
+            distributions.append((cells, self._enumerate(cells, component)))
+
+        interior = hidden - sum(len(cells) for cells, _ in distributions)
+
+        def weight(mines):
+            rest = mines_left - mines
+            return math.comb(interior, rest) if 0 <= rest <= interior else 0
+
+        totals = [convolve([counts for _, (counts, _) in distributions[:k] + distributions[k+1:]])
+                  for k in range(len(distributions))]
+        everything = convolve([counts for _, (counts, _) in distributions])
+        z = sum(ways * weight(mines) for mines, ways in enumerate(everything))
+        if not z:
+            return probabilities, mines_left / hidden if hidden else 1.0
+
+        for (cells, (counts, cell_counts)), others in zip(distributions, totals):
+            # Ways the other components and the interior complete k mines here
+            completions = [sum(ways * weight(k + mines) for mines, ways in enumerate(others))
+                           for k in range(len(counts))]
+            for pos, cell in enumerate(cells):
+                mined = sum(cell_counts[k][pos] * completions[k] for k in range(len(counts)) if cell_counts[k])
+                probabilities[cell] = mined / z
+        if interior:
+            expected = sum(ways * weight(mines) * (mines_left - mines) for mines, ways in enumerate(everything))
+            return probabilities, expected / z / interior
+        return probabilities, 1.0
+
+    def _components(self, constraints):
+        """Split constraints into groups sharing no cells; yield (ordered cells, constraints)."""
+        by_cell = {}
+        for k, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(k)
+        seen = [False] * len(constraints)
+        for start in range(len(constraints)):
+            if seen[start]:
+                continue
+            # Breadth-first over shared cells, so each constraint's cells are
+            # assigned close together and it can be checked early
+            seen[start] = True
+            queue, order, cell_seen = [start], [], set()
+            for k in queue:
+                for cell in sorted(constraints[k][0]):
+                    if cell in cell_seen:
+                        continue
+                    cell_seen.add(cell)
+                    order.append(cell)
+                    for other in by_cell[cell]:
+                        if not seen[other]:
+                            seen[other] = True
+                            queue.append(other)
+            yield order, [constraints[k] for k in queue]
+
+    def _enumerate(self, cells, constraints):
+        """Count mine layouts of a component.
+
+        Returns (counts, cell_counts): counts[k] is the number of layouts
+        with k mines, cell_counts[k][pos] how many of those mine cells[pos].
+        """
+        position = {cell: pos for pos, cell in enumerate(cells)}
+        need = [count for _, count in constraints]
+        free = [len(c) for c, _ in constraints]
+        cell_constraints = [[] for _ in cells]
+        for k, (c, _) in enumerate(constraints):
+            for cell in c:
+                cell_constraints[position[cell]].append(k)
+        size = len(cells)
+        counts = [0] * (size + 1)
+        cell_counts = [None] * (size + 1)
+        layout = [0] * size
+
+        def place(pos, mines):
+            if pos == size:
+                counts[mines] += 1
+                if cell_counts[mines] is None:
+                    cell_counts[mines] = [0] * size
+                tally = cell_counts[mines]
+                for p, mine in enumerate(layout):
+                    if mine:
+                        tally[p] += 1
+                return
+            touched = cell_constraints[pos]
+            for mine in (0, 1):
+                ok = True
+                for k in touched:
+                    free[k] -= 1
+                    need[k] -= mine
+                    if need[k] < 0 or need[k] > free[k]:
+                        ok = False
+                if ok:
+                    layout[pos] = mine
+                    place(pos + 1, mines + mine)
+                for k in touched:
+                    free[k] += 1
+                    need[k] += mine
+            layout[pos] = 0
+
+        place(0, 0)
+        return counts, cell_counts
+
+    def _safest(self, probabilities, interior, cells):
+        best = min(probabilities.items(), key=lambda item: item[1], default=(None, 1.0))
+        if best[0] is not None and best[1] <= interior:
+            return best[0]
+        # Away from the frontier, corners and edges are likelier to open a region
+        neighbors = self.neighbors
+        candidates = [i for i, state in enumerate(cells)
+                      if state == HIDDEN and i not in probabilities]
+        return min(candidates, key=lambda i: len(neighbors[i]), default=best[0])
+
+
+def convolve(distributions):
+    """Distribution of the summed mine count of independent components."""
+    total = [1]
+    for counts in distributions:
+        combined = [0] * (len(total) + len(counts) - 1)
+        for a, x in enumerate(total):
+            if x:
+                for b, y in enumerate(counts):
+                    combined[a + b] += x * y
+        total = combined
+    return total
+
+
+def play_game(board):
+    """Let the solver play `board` to the end; return (won, guesses)."""
+    solver = MinesweeperSolver(board)
+    while True:
+        move = solver.next_move()
+        if move is None:
+            return not board.game_over, solver.guesses
+        action, row, col = move
+        if action == 'flag':
+            board.toggle_flag(row, col)
+        else:
+            board.dig(row, col)
+
+
+def benchmark(dim_size, num_bombs, games, seed=None, safe_first_click=False):
+    rng = random.Random(seed)
+    wins = guesses = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        won, guessed = play_game(Board(dim_size, num_bombs, rng, safe_first_click))
+        wins += won
+        guesses += guessed
+    elapsed = time.perf_counter() - start
+    return {
+        'games': games,
+        'wins': wins,
+        'win_rate': wins / games if games else 0.0,
+        'mean_guesses': guesses / games if games else 0.0,
+        'games_per_min': games / elapsed * 60 if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Let the solver play headless Minesweeper games")
+    parser.add_argument('-n', '--games', type=int, default=1000, help="games per difficulty")
+    parser.add_argument('-d', '--difficulty', nargs='+', choices=sorted(DIFFICULTIES),
+                        default=list(DIFFICULTIES))
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible boards")
+    parser.add_argument('--safe-first-click', action='store_true', help="first dig always opens a region")
+    args = parser.parse_args()
+    if args.games < 1:
+        print(f"{Fore.RED}Error: --games must be at least 1{Style.RESET_ALL}")
+        sys.exit(1)
+
+    for difficulty in args.difficulty:
+        dim_size, num_bombs = DIFFICULTIES[difficulty]
+        report = benchmark(dim_size, num_bombs, args.games, args.seed, args.safe_first_click)
+        print(f"\n{Fore.YELLOW}{difficulty.title()} ({dim_size}x{dim_size}, {num_bombs} bombs){Style.RESET_ALL}")
+        print(f"{Fore.GREEN}Won {report['wins']}/{report['games']} ({report['win_rate']:.1%})")
+        print(f"{Fore.CYAN}Guesses per game: {report['mean_guesses']:.2f}")
+        print(f"{Fore.CYAN}Throughput: {report['games_per_min']:,.0f} games/min")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+import argparse
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from colorama import Fore, Style
+from main import ENGINES
+
+
+def parse_line(line):
+    """81-character puzzle line ('0' or '.' for empty) -> rows with -1 for empty."""
+    if len(line) != 81:
+        raise ValueError(f"Expected 81 characters, got {len(line)}: {line[:20]}...")
+    values = [-1 if ch in '0.' else int(ch) for ch in line]
+    return [values[r*9:(r+1)*9] for r in range(9)]
+
+
+def format_grid(grid):
+    return ''.join(str(value) if value != -1 else '.' for row in grid for value in row)
+
+
+def read_puzzles(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+
+def solve_chunk(lines, engine_name):
+    """Solve a list of puzzle lines; return [(output line, solved, seconds, steps)]."""
+    engine = ENGINES[engine_name]()
+    results = []
+    for line in lines:
+        grid = parse_line(line)
+        # Unsolvable puzzles are written back as given, in the same '.' format as solutions
+        given = format_grid(grid)
+        start = time.perf_counter()
+        solved = engine.solve(grid)
+        elapsed = time.perf_counter() - start
+        results.append((format_grid(grid) if solved else given, solved, elapsed, engine.steps))
+    return results
+
+
+def chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))]
+
+
+def solve_file(in_path, out_path, engine='bitmask', workers=None, chunk_size=500, max_pending=None):
+    """Solve every puzzle in in_path across a process pool, writing solutions in order.
+
+    At most max_pending chunks are in flight, so memory stays bounded no
+    matter how large the input is.
+    """
+    workers = workers or os.cpu_count()
+    max_pending = max_pending or workers * 4
+    times = array('d')
+    steps = array('q')
+    unsolved = 0
+    chunks = chunked(read_puzzles(in_path), chunk_size)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(out_path, 'w', encoding='utf-8') as out:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(solve_chunk, chunk, engine))
+            if len(pending) >= max_pending:
+                unsolved += write_results(pending.popleft().result(), out, times, steps)
+        while pending:
+            unsolved += write_results(pending.popleft().result(), out, times, steps)
+    elapsed = time.perf_counter() - start
+
+    sorted_times = sorted(times)
+    sorted_steps = sorted(steps)
+    count = len(times)
+    return {
+        'puzzles': count,
+        'unsolved': unsolved,
+        'seconds': elapsed,
+        'puzzles_per_sec': count / elapsed if elapsed else 0.0,
+        'mean_time': sum(times) / count if count else 0.0,
+        'p99_time': percentile(sorted_times, 99),
+        'max_time': sorted_times[-1] if count else 0.0,
+        'steps': {p: percentile(sorted_steps, p) for p in (0, 50, 90, 99, 100)},
+        'steps_histogram': steps_histogram(sorted_steps),
+    }
+
+
+def write_results(results, out, times, steps):
+    unsolved = 0
+    for line, solved, elapsed, step_count in results:
+        out.write(line + '\n')
+        times.append(elapsed)
+        steps.append(step_count)
+        if not solved:
+            unsolved += 1
+    return unsolved
+
+
+def steps_histogram(sorted_steps):
+    """Puzzle counts per power-of-two bucket of steps: {upper bound: count}."""
+    histogram = {}
+    for value in sorted_steps:
+        bucket = 1 << max(0, value - 1).bit_length()
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    return histogram
+
+
+def print_report(report):
+    print(f"\n{Fore.YELLOW}Solved {report['puzzles'] - report['unsolved']}/{report['puzzles']} puzzles "
+          f"in {report['seconds']:.2f}s{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Throughput: {report['puzzles_per_sec']:.1f} puzzles/sec")
+    print(f"{Fore.CYAN}Solve time: mean {report['mean_time'] * 1000:.3f}ms | "
+          f"p99 {report['p99_time'] * 1000:.3f}ms | max {report['max_time'] * 1000:.3f}ms")
+    s = report['steps']
+    print(f"{Fore.CYAN}Steps: min {s[0]} | median {s[50]} | p90 {s[90]} | p99 {s[99]} | max {s[100]}")
+    print(f"{Fore.MAGENTA}Steps distribution:")
+    for bucket, count in sorted(report['steps_histogram'].items()):
+        print(f"{Fore.WHITE}  <= {bucket:>7}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a file of 81-character Sudoku puzzles in bulk")
+    parser.add_argument('input', help="one puzzle per line, '0' or '.' for empty cells")
+    parser.add_argument('-o', '--output', default=None, help="defaults to <input>.solved")
+    parser.add_argument('-e', '--engine', choices=sorted(ENGINES), default='bitmask')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+
+    out_path = args.output or args.input + '.solved'
+    try:
+        report = solve_file(args.input, out_path, args.engine, args.workers, args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+    print_report(report)
+    print(f"\n{Fore.GREEN}Solutions written to {out_path}{Style.RESET_ALL}")
+
+
+if __name__ == '__main__':
+    main()
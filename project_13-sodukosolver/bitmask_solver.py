@@ -0,0 +1,234 @@
+class SearchLimit(Exception):
+    pass
+
+
+class BitmaskSolver:
+    """Constraint-propagation Sudoku solver.
+
+    Every row, column and box keeps a bitmask of the digits it already holds
+    (bit d-1 for digit d), updated as cells are filled and undone, so a cell's
+    candidates are a single OR. Naked and hidden singles are filled before
+    each guess, and guesses go to the cell with the fewest candidates.
+    `steps` counts search nodes, like SudokuSolver.steps does for the
+    backtracker.
+    """
+
+    # Puzzle ratings by the hardest technique needed, easiest first
+    RATINGS = ('easy', 'medium', 'hard')
+
+    def __init__(self, box=3):
+        self.box = box
+        self.size = box * box
+        self.full = (1 << self.size) - 1
+        n = self.size
+        self.cell_row = [i // n for i in range(n * n)]
+        self.cell_col = [i % n for i in range(n * n)]
+        self.cell_box = [(i // n // box) * box + (i % n) // box for i in range(n * n)]
+        self.units = (
+            [[r * n + c for c in range(n)] for r in range(n)] +
+            [[r * n + c for r in range(n)] for c in range(n)] +
+            [[i for i in range(n * n) if self.cell_box[i] == b] for b in range(n)]
+        )
+        self.geometry = [(i, self.cell_row[i], self.cell_col[i], self.cell_box[i]) for i in range(n * n)]
+        self.unit_geometry = [[self.geometry[i] for i in unit] for unit in self.units]
+        self.steps = 0
+
+    def solve(self, puzzle):
+        """Fill `puzzle` (rows of ints, -1 for empty) in place; return True if solved."""
+        return run_to_end(self.solve_steps(puzzle, None))
+
+    def solve_steps(self, puzzle, yield_every=1000):
+        """Resumable solve: yields `steps` after every yield_every search nodes.
+
+        The generator's return value is True once `puzzle` has been filled in
+        place, or False if it has no solution. Closing it early cancels the
+        solve and leaves `puzzle` untouched.
+        """
+        self.steps = 0
+        self.limit, self.found, self.max_steps = 1, 0, None
+        if not self._load(puzzle):
+            return False
+        if not (yield from self._search(yield_every)):
+            return False
+        n = self.size
+        for i, bit in enumerate(self.cells):
+            puzzle[i // n][i % n] = bit.bit_length()
+        return True
+
+    def count_solutions(self, puzzle, limit=2, max_steps=None):
+        """Count solutions, stopping as soon as `limit` are found.
+
+        If the search runs past max_steps it gives up and reports `limit`,
+        so an undecided puzzle is treated as having too many solutions.
+        """
+        self.steps = 0
+        self.limit, self.found, self.max_steps = limit, 0, max_steps
+        if self._load(puzzle):
+            try:
+                run_to_end(self._search(None))
+            except SearchLimit:
+                return limit
+        return self.found
+
+    def rate(self, puzzle):
+        """Rate by technique: 'easy' needs only naked singles, 'medium' also
+        hidden singles, 'hard' needs guessing (or has no solution)."""
+        if not self._load(puzzle):
+            return 'hard'
+        for rating, hidden in (('easy', False), ('medium', True)):
+            ok, cell = self._propagate([], hidden)
+            if not ok:
+                return 'hard'
+            if cell is None:
+                return rating
+        return 'hard'
+
+    def _load(self, puzzle):
+        n = self.size
+        self.cells = [0] * (n * n)
+        self.row_used = [0] * n
+        self.col_used = [0] * n
+        self.box_used = [0] * n
+        for r in range(n):
+            for c in range(n):
+                value = puzzle[r][c]
+                if value == -1:
+                    continue
+                cell = r * n + c
+                bit = 1 << (value - 1)
+                if not self._candidates(cell) & bit:
+                    return False  # Clue clashes with another clue
+                self._assign(cell, bit, [])
+        return True
+
+    def _candidates(self, cell):
+        return self.full & ~(self.row_used[self.cell_row[cell]] |
+                             self.col_used[self.cell_col[cell]] |
+                             self.box_used[self.cell_box[cell]])
+
+    def _assign(self, cell, bit, trail):
+        self.cells[cell] = bit
+        self.row_used[self.cell_row[cell]] |= bit
+        self.col_used[self.cell_col[cell]] |= bit
+        self.box_used[self.cell_box[cell]] |= bit
+        trail.append(cell)
+
+    def _unassign(self, cell):
+        bit = self.cells[cell]
+        self.cells[cell] = 0
+        self.row_used[self.cell_row[cell]] ^= bit
+        self.col_used[self.cell_col[cell]] ^= bit
+        self.box_used[self.cell_box[cell]] ^= bit
+
+    def _propagate(self, trail, hidden_singles=True):
+        """Fill singles until none are left.
+
+        Returns (ok, cell): ok is False on a contradiction, and cell is the
+        empty cell with the fewest candidates (None when the grid is full).
+        """
+        cells, full = self.cells, self.full
+        row_used, col_used, box_used = self.row_used, self.col_used, self.box_used
+        # One (cell, row, col, box) tuple per cell keeps the hot loops on locals
+        geometry = self.geometry
+        while True:
+            changed = False
+            best_cell, best_count = None, self.size + 1
+
+            # Naked singles: a cell with only one candidate
+            for cell, r, c, b in geometry:
+                if cells[cell]:
+                    continue
+                cand = full & ~(row_used[r] | col_used[c] | box_used[b])
+                if not cand:
+                    return False, None
+                if not cand & (cand - 1):
+                    self._assign(cell, cand, trail)
+                    changed = True
+                    continue
+                count = cand.bit_count()
+                if count < best_count:
+                    best_cell, best_count = cell, count
+            if changed:
+                continue
+            if not hidden_singles:
+                return True, best_cell
+
+            # Hidden singles: a digit that fits only one cell of a unit
+            for unit in self.unit_geometry:
+                once = twice = used = 0
+                for cell, r, c, b in unit:
+                    if cells[cell]:
+                        used |= cells[cell]
+                        continue
+                    cand = full & ~(row_used[r] | col_used[c] | box_used[b])
+                    twice |= once & cand
+                    once |= cand
+                if once | used != full:
+                    return False, None  # Some digit has nowhere to go
+                hidden = once & ~twice
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for cell, r, c, b in unit:
+                        if not cells[cell] and not (row_used[r] | col_used[c] | box_used[b]) & bit:
+                            self._assign(cell, bit, trail)
+                            changed = True
+                            break
+            if not changed:
+                return True, best_cell
+
+    def _search(self, yield_every):
+        """Depth-first search with an explicit stack so it can pause between nodes.
+
+        Each frame is [trail, cell, untried candidates] for a node that
+        branched; the trail holds the singles its propagation filled.
+        Returns True once `limit` solutions have been found.
+        """
+        stack = []
+        entering = True
+        while True:
+            if entering:
+                self.steps += 1
+                if self.max_steps is not None and self.steps > self.max_steps:
+                    raise SearchLimit
+                if yield_every and self.steps % yield_every == 0:
+                    yield self.steps
+
+                trail = []
+                ok, cell = self._propagate(trail)
+                if ok and cell is None:
+                    self.found += 1
+                    if self.found >= self.limit:
+                        return True
+                    ok = False  # Keep looking: undo and try the next branch
+                if ok:
+                    stack.append([trail, cell, self._candidates(cell)])
+                else:
+                    for filled in reversed(trail):
+                        self._unassign(filled)
+
+            if not stack:
+                return False
+            frame = stack[-1]
+            trail, cell, cand = frame
+            if self.cells[cell]:
+                self._unassign(cell)  # Undo the previous guess at this node
+            if cand:
+                bit = cand & -cand
+                frame[2] = cand ^ bit
+                self._assign(cell, bit, [])
+                entering = True
+            else:
+                stack.pop()
+                for filled in reversed(trail):
+                    self._unassign(filled)
+                entering = False
+
+
+def run_to_end(steps):
+    """Drive a step generator to completion and return its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
@@ -0,0 +1,159 @@
+class DancingLinksSolver:
+    """Knuth's Algorithm X with dancing links over Sudoku's exact-cover matrix.
+
+    Each candidate (row, col, digit) is a matrix row covering four columns:
+    its cell, the digit in its row, the digit in its column and the digit in
+    its box. The links are kept in flat int lists rather than node objects.
+    `steps` counts search nodes.
+    """
+
+    def __init__(self, box=3):
+        self.box = box
+        self.size = box * box
+        self.steps = 0
+
+    def solve(self, puzzle):
+        """Fill `puzzle` in place with its first solution; return True if one exists."""
+        for solution in self.solutions(puzzle, limit=1):
+            for r, row in enumerate(solution):
+                puzzle[r][:] = row
+            return True
+        return False
+
+    def count_solutions(self, puzzle, limit=None):
+        """Count solutions, stopping early once `limit` have been found."""
+        return sum(1 for _ in self.solutions(puzzle, limit))
+
+    def solutions(self, puzzle, limit=None):
+        """Yield every solution as a new grid, at most `limit` of them."""
+        self.steps = 0
+        if not self._build(puzzle):
+            return
+        found = 0
+        for chosen in self._search([]):
+            grid = [row[:] for row in puzzle]
+            for r, c, d in chosen:
+                grid[r][c] = d + 1
+            yield grid
+            found += 1
+            if limit is not None and found >= limit:
+                return
+
+    def _build(self, puzzle):
+        n = self.size
+        num_columns = 4 * n * n
+        # Node 0 is the root, nodes 1..num_columns are the column headers
+        self.L = [num_columns] + list(range(num_columns))
+        self.R = list(range(1, num_columns + 1)) + [0]
+        self.U = list(range(num_columns + 1))
+        self.D = list(range(num_columns + 1))
+        self.C = list(range(num_columns + 1))
+        self.S = [0] * (num_columns + 1)
+        self.row_of = [None] * (num_columns + 1)
+        first_node = {}
+
+        for r in range(n):
+            for c in range(n):
+                b = (r // self.box) * self.box + c // self.box
+                for d in range(n):
+                    columns = (
+                        1 + r * n + c,
+                        1 + n * n + r * n + d,
+                        1 + 2 * n * n + c * n + d,
+                        1 + 3 * n * n + b * n + d,
+                    )
+                    first = len(self.C)
+                    for k, col in enumerate(columns):
+                        node = first + k
+                        self.C.append(col)
+                        self.row_of.append((r, c, d))
+                        # Append to the bottom of the column
+                        self.U.append(self.U[col])
+                        self.D.append(col)
+                        self.D[self.U[col]] = node
+                        self.U[col] = node
+                        self.S[col] += 1
+                        # Link into a circular row
+                        self.L.append(first + (k - 1) % 4)
+                        self.R.append(first + (k + 1) % 4)
+                    first_node[(r, c, d)] = first
+
+        # Clues are rows that must be in the cover
+        covered = set()
+        for r in range(n):
+            for c in range(n):
+                value = puzzle[r][c]
+                if value == -1:
+                    continue
+                node = first_node[(r, c, value - 1)]
+                columns = [self.C[node + k] for k in range(4)]
+                if covered.intersection(columns):
+                    return False  # Clue clashes with another clue
+                covered.update(columns)
+                for col in columns:
+                    self._cover(col)
+        return True
+
+    def _cover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[col]] = R[col]
+        L[R[col]] = L[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[col]] = col
+        L[R[col]] = col
+
+    def _search(self, chosen):
+        self.steps += 1
+        R, D, C, S = self.R, self.D, self.C, self.S
+        if R[0] == 0:
+            yield chosen
+            return
+
+        # Branch on the column with the fewest remaining rows
+        col, best = None, None
+        j = R[0]
+        while j != 0:
+            if best is None or S[j] < best:
+                col, best = j, S[j]
+                if best <= 1:
+                    break
+            j = R[j]
+        if best == 0:
+            return
+
+        self._cover(col)
+        row = D[col]
+        while row != col:
+            chosen.append(self.row_of[row])
+            j = R[row]
+            while j != row:
+                self._cover(C[j])
+                j = R[j]
+            yield from self._search(chosen)
+            j = self.L[row]
+            while j != row:
+                self._uncover(C[j])
+                j = self.L[j]
+            chosen.pop()
+            row = D[row]
+        self._uncover(col)
@@ -0,0 +1,154 @@
+import queue
+import random
+import threading
+from contextlib import contextmanager
+from bitmask_solver import BitmaskSolver
+
+# Search nodes allowed per uniqueness check on 16x16 and larger grids, counted
+# for a 9x9 grid and scaled down by cell count, since each node costs more on
+# bigger grids. Removals that cannot be settled within it are rejected, which
+# keeps generation time bounded. 9x9 checks run to completion as they always have.
+UNIQUENESS_STEPS = 200
+
+# Clue floors per difficulty for 9x9, drawn the same way the original generator
+# did; other sizes keep the same fraction of the grid
+CLUE_RANGES = {
+    'easy': (36, 45),
+    'medium': (27, 35),
+    'hard': (17, 26),
+}
+
+
+def solved_grid(box=3, rng=random):
+    """A random complete grid: shuffled diagonal boxes, then solved."""
+    size = box * box
+    grid = [[-1 for _ in range(size)] for _ in range(size)]
+    for start in range(0, size, box):
+        nums = list(range(1, size + 1))
+        rng.shuffle(nums)
+        for i in range(box):
+            for j in range(box):
+                grid[start+i][start+j] = nums.pop()
+    BitmaskSolver(box).solve(grid)
+    return grid
+
+
+def clue_floor(difficulty, box=3, rng=random):
+    low, high = CLUE_RANGES.get(difficulty, CLUE_RANGES['medium'])
+    clues = rng.randint(low, high)
+    return clues if box == 3 else round(clues / 81 * box ** 4)
+
+
+def generate_unique_puzzle(difficulty='medium', min_clues=None, rng=random, attempts=5, box=3, checkpoint=None):
+    """Return (puzzle, solution, rating) where the puzzle has exactly one solution.
+
+    A fresh grid is carved up to `attempts` times until one reaches the
+    requested rating; the last attempt is returned otherwise.
+    """
+    for _ in range(attempts):
+        puzzle, solution, rating = carve_puzzle(difficulty, min_clues, rng, box, checkpoint)
+        if rating == difficulty:
+            break
+    return puzzle, solution, rating
+
+
+def carve_puzzle(difficulty='medium', min_clues=None, rng=random, box=3, checkpoint=None):
+    """Remove clues from a random solved grid.
+
+    Clues are removed one at a time in random order. A removal is kept only
+    if the puzzle still has a unique solution and still rates no harder than
+    `difficulty`. Removal stops once min_clues are left and the puzzle has
+    reached the requested rating, or when no more clues can go.
+
+    checkpoint, if given, is called before every removal; it may block to
+    pause generation.
+    """
+    if min_clues is None:
+        min_clues = clue_floor(difficulty, box, rng)
+    max_rating = BitmaskSolver.RATINGS.index(difficulty) if difficulty in BitmaskSolver.RATINGS \
+        else len(BitmaskSolver.RATINGS) - 1
+
+    size = box * box
+    max_steps = None if box == 3 else max(1, UNIQUENESS_STEPS * 81 // size ** 2)
+    solver = BitmaskSolver(box)
+    solution = solved_grid(box, rng)
+    puzzle = [row[:] for row in solution]
+    clues = size * size
+    rating = 0
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+
+    for r, c in cells:
+        if clues <= min_clues and rating >= max_rating:
+            break
+        if checkpoint is not None:
+            checkpoint()
+        value = puzzle[r][c]
+        puzzle[r][c] = -1
+        new_rating = BitmaskSolver.RATINGS.index(solver.rate(puzzle))
+        # Singles are forced moves, so a puzzle they solve is already unique;
+        # only puzzles needing guesses go to the counter, which stops at 2
+        if new_rating > max_rating or (
+                new_rating == len(BitmaskSolver.RATINGS) - 1 and
+                solver.count_solutions(puzzle, limit=2, max_steps=max_steps) != 1):
+            puzzle[r][c] = value
+        else:
+            clues -= 1
+            rating = new_rating
+
+    return puzzle, solution, BitmaskSolver.RATINGS[rating]
+
+
+class PuzzlePool:
+    """Keeps a few puzzles per difficulty ready, generated on a background thread.
+
+    The thread shares the GIL with the caller, so pause it around anything
+    timed; it halts before its next clue removal and picks up where it left off.
+    """
+
+    def __init__(self, size=3, difficulties=tuple(CLUE_RANGES)):
+        self.queues = {difficulty: queue.Queue(maxsize=size) for difficulty in difficulties}
+        self.stopped = threading.Event()
+        self.running = threading.Event()
+        self.running.set()
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.running.set()
+
+    def pause(self):
+        self.running.clear()
+
+    def resume(self):
+        self.running.set()
+
+    @contextmanager
+    def paused(self):
+        self.pause()
+        try:
+            yield self
+        finally:
+            self.resume()
+
+    def get(self, difficulty):
+        """Serve a ready puzzle, or generate one now if the pool is empty."""
+        try:
+            return self.queues[difficulty].get_nowait()
+        except (KeyError, queue.Empty):
+            return generate_unique_puzzle(difficulty)
+
+    def _fill(self):
+        rng = random.Random()
+        while not self.stopped.is_set():
+            # Top up whichever difficulty has the fewest puzzles ready
+            difficulty, q = min(self.queues.items(), key=lambda item: item[1].qsize())
+            if q.full():
+                self.stopped.wait(0.1)
+                continue
+            self.running.wait()
+            q.put(generate_unique_puzzle(difficulty, rng=rng, checkpoint=self.running.wait))
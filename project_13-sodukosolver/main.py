@@ -2,19 +2,31 @@ import sys
 import time
 from colorama import Fore, Style, init, Back
 from pprint import pprint
-import random
+from bitmask_solver import BitmaskSolver
+from dlx import DancingLinksSolver
+from generator import generate_unique_puzzle, PuzzlePool
+
+ENGINES = {
+    'bitmask': BitmaskSolver,
+    'dlx': DancingLinksSolver,
+}
 
 # Initialize colorama
 init(autoreset=True)
 
 class SudokuSolver:
-    def __init__(self):
-        self.puzzle = [[-1 for _ in range(9)] for _ in range(9)]
+    def __init__(self, box=3):
+        self.box = box
+        self.size = box * box
+        self.puzzle = [[-1 for _ in range(self.size)] for _ in range(self.size)]
         self.original_puzzle = None
         self.solving = False
         self.start_time = 0
         self.solve_time = 0
         self.steps = 0
+        self.engine = 'bitmask'  # A key of ENGINES, or 'backtrack' for solve_sudoku
+        self.difficulty = None
+        self.pool = None  # Optional PuzzlePool of ready-made puzzles
 
     def print_banner(self):
         print(Fore.CYAN + r"""
@@ -29,8 +41,8 @@ class SudokuSolver:
         print(Fore.GREEN + "="*50)
 
     def find_next_empty(self, puzzle):
-        for r in range(9):
-            for c in range(9):
+        for r in range(self.size):
+            for c in range(self.size):
                 if puzzle[r][c] == -1:
                     return r, c
         return None, None
@@ -41,14 +53,14 @@ class SudokuSolver:
             return False
 
         # Check column
-        if guess in [puzzle[i][col] for i in range(9)]:
+        if guess in [puzzle[i][col] for i in range(self.size)]:
             return False
 
-        # Check 3x3 box
-        row_start = (row // 3) * 3
-        col_start = (col // 3) * 3
-        for r in range(row_start, row_start + 3):
-            for c in range(col_start, col_start + 3):
+        # Check box
+        row_start = (row // self.box) * self.box
+        col_start = (col // self.box) * self.box
+        for r in range(row_start, row_start + self.box):
+            for c in range(col_start, col_start + self.box):
                 if puzzle[r][c] == guess:
                     return False
         return True
@@ -60,7 +72,7 @@ class SudokuSolver:
         if row is None:
             return True
 
-        for guess in range(1, 10):
+        for guess in range(1, self.size + 1):
             if self.is_valid(puzzle, guess, row, col):
                 puzzle[row][col] = guess
                 if self.solve_sudoku(puzzle):
@@ -69,59 +81,108 @@ class SudokuSolver:
 
         return False
 
-    def generate_puzzle(self, difficulty='medium'):
-        # Start with empty puzzle
-        self.puzzle = [[-1 for _ in range(9)] for _ in range(9)]
-        
-        # Fill diagonal 3x3 boxes first (they are independent)
-        for box in range(0, 9, 3):
-            nums = list(range(1, 10))
-            random.shuffle(nums)
-            for i in range(3):
-                for j in range(3):
-                    self.puzzle[box+i][box+j] = nums.pop()
-
-        # Solve the complete puzzle
-        self.solve_sudoku(self.puzzle)
-        
-        # Now remove numbers based on difficulty
-        cells_to_keep = {
-            'easy': random.randint(36, 45),
-            'medium': random.randint(27, 35),
-            'hard': random.randint(17, 26)
-        }.get(difficulty, 27)
-
-        all_cells = [(r, c) for r in range(9) for c in range(9)]
-        random.shuffle(all_cells)
-        
-        for i in range(81 - cells_to_keep):
-            r, c = all_cells[i]
-            self.puzzle[r][c] = -1
+    def solve_sudoku_steps(self, puzzle, yield_every=1000):
+        # Same search as solve_sudoku, pausing every yield_every steps
+        self.steps += 1
+        if yield_every and self.steps % yield_every == 0:
+            yield
+        row, col = self.find_next_empty(puzzle)
+
+        if row is None:
+            return True
+
+        for guess in range(1, self.size + 1):
+            if self.is_valid(puzzle, guess, row, col):
+                puzzle[row][col] = guess
+                if (yield from self.solve_sudoku_steps(puzzle, yield_every)):
+                    return True
+                puzzle[row][col] = -1
+
+        return False
+
+    def solve(self, puzzle):
+        if self.engine == 'backtrack':
+            return self.solve_sudoku(puzzle)
+        engine = ENGINES[self.engine](self.box)
+        solved = engine.solve(puzzle)
+        self.steps += engine.steps
+        return solved
 
+    def solve_steps(self, puzzle, yield_every=1000):
+        """Resumable solve that keeps self.steps current between yields.
+
+        Returns True when `puzzle` has been solved in place. Dancing links has
+        no pause points, so it runs to completion on the first resume.
+        """
+        if self.engine == 'backtrack':
+            return (yield from self.solve_sudoku_steps(puzzle, yield_every))
+        if self.engine != 'bitmask':
+            return self.solve(puzzle)
+
+        engine = ENGINES[self.engine](self.box)
+        start_steps = self.steps
+        steps = engine.solve_steps(puzzle, yield_every)
+        while True:
+            try:
+                self.steps = start_steps + next(steps)
+            except StopIteration as done:
+                self.steps = start_steps + engine.steps
+                return done.value
+            yield
+
+    def select_engine(self):
+        print(Fore.CYAN + "\nSelect Solver:")
+        print(Fore.WHITE + "1. Constraint propagation (default)")
+        print(Fore.WHITE + "2. Dancing links (also checks uniqueness)")
+        print(Fore.WHITE + "3. Backtracking")
+        choice = input(Fore.YELLOW + "> ").strip()
+        self.engine = {'2': 'dlx', '3': 'backtrack'}.get(choice, 'bitmask')
+
+    def generate_puzzle(self, difficulty='medium', min_clues=None):
+        # Pre-generated puzzles are served instantly; custom clue counts are made on demand
+        if self.pool is not None and min_clues is None and self.box == 3:
+            puzzle, _, rating = self.pool.get(difficulty)
+        else:
+            # Larger grids take one carving pass; retries cost too much there
+            attempts = 5 if self.box == 3 else 1
+            if self.box > 3:
+                print(Fore.YELLOW + f"\nGenerating a {self.size}x{self.size} puzzle, hard ones can take half a minute...")
+            puzzle, _, rating = generate_unique_puzzle(difficulty, min_clues, attempts=attempts, box=self.box)
+
+        self.puzzle = puzzle
+        self.difficulty = rating
         self.original_puzzle = [row[:] for row in self.puzzle]
 
-    def print_puzzle(self, highlight=None):
-        clear_screen()
+    def print_puzzle(self, highlight=None, redraw=False):
+        if redraw:
+            print("\033[H", end="")  # Draw over the last frame instead of clearing
+        else:
+            clear_screen()
         self.print_banner()
         
         if self.solving:
-            print(Fore.MAGENTA + f"\nSolving... Steps: {self.steps} | Time: {time.time() - self.start_time:.2f}s")
+            print(Fore.MAGENTA + f"\nSolving... Steps: {self.steps} | Time: {time.time() - self.start_time:.2f}s" + "\033[K")
         else:
-            print(Fore.CYAN + "\nCurrent Puzzle:")
+            rating = f" ({self.difficulty})" if self.difficulty else ""
+            print(Fore.CYAN + f"\nCurrent Puzzle{rating}:")
 
-        print(Fore.WHITE + "    " + "   ".join([f"{i}" for i in range(9)]))
-        print("  ╔═══╦═══╦═══╦═══╦═══╦═══╦═══╦═══╦═══╗")
+        width = len(str(self.size))
+        label = len(str(self.size - 1))
+        bar = "═" * (width + 2)
+        margin = " " * (label + 1)
+        print(Fore.WHITE + " " * (label + 3) + "".join(str(i).rjust(width).ljust(width + 3) for i in range(self.size)).rstrip())
+        print(margin + "╔" + "╦".join([bar] * self.size) + "╗")
         
         for i, row in enumerate(self.puzzle):
-            row_str = f"{i} ║"
+            row_str = f"{i:>{label}} ║"
             for j, num in enumerate(row):
                 if num == -1:
-                    cell = " "
+                    cell = " " * width
                 else:
                     if self.original_puzzle and self.original_puzzle[i][j] == -1 and num != -1:
-                        cell = Fore.GREEN + str(num)  # User-filled cells in green
+                        cell = Fore.GREEN + str(num).rjust(width)  # User-filled cells in green
                     else:
-                        cell = Fore.WHITE + str(num)  # Original clues in white
+                        cell = Fore.WHITE + str(num).rjust(width)  # Original clues in white
                 
                 if highlight and highlight == (i, j):
                     cell = Back.YELLOW + Fore.BLACK + cell
@@ -129,30 +190,63 @@ class SudokuSolver:
                 row_str += f" {cell} ║"
             
             print(row_str)
-            if i < 8:
-                if (i + 1) % 3 == 0:
-                    print("  ╠═══╬═══╬═══╬═══╬═══╬═══╬═══╬═══╬═══╣")
+            if i < self.size - 1:
+                if (i + 1) % self.box == 0:
+                    print(margin + "╠" + "╬".join([bar] * self.size) + "╣")
                 else:
-                    print("  ║───║───║───║───║───║───║───║───║───║")
+                    print(margin + "║" + "║".join(["─" * (width + 2)] * self.size) + "║")
         
-        print("  ╚═══╩═══╩═══╩═══╩═══╩═══╩═══╩═══╩═══╝")
+        print(margin + "╚" + "╩".join([bar] * self.size) + "╝")
 
-    def interactive_solve(self):
+    def interactive_solve(self, fps=10, yield_every=200):
+        self.select_engine()
         self.solving = True
+        if self.pool is not None:
+            self.pool.pause()  # Its generator thread would share the GIL with the timed solve
         self.start_time = time.time()
         self.steps = 0
         
         temp_puzzle = [row[:] for row in self.puzzle]
-        solved = self.solve_sudoku(temp_puzzle)
+        solver = self.solve_steps(temp_puzzle, yield_every)
+        clear_screen()
+        last_frame = 0
+        try:
+            while True:
+                try:
+                    next(solver)
+                except StopIteration as done:
+                    solved = done.value
+                    break
+                # Redraw at a fixed frame rate however fast the steps come
+                if time.time() - last_frame >= 1 / fps:
+                    self.print_puzzle(redraw=True)
+                    print(Fore.YELLOW + "\nPress Ctrl+C to cancel")
+                    last_frame = time.time()
+        except KeyboardInterrupt:
+            solver.close()
+            self.solving = False
+            print(Fore.RED + f"\nSolve cancelled after {self.steps} steps")
+            return
+        finally:
+            self.solve_time = time.time() - self.start_time
+            if self.pool is not None:
+                self.pool.resume()
         
-        self.solve_time = time.time() - self.start_time
         self.solving = False
         
         if solved:
+            # The board as the user filled it in, kept for the uniqueness check
+            entered = self.puzzle
             self.puzzle = temp_puzzle
             self.print_puzzle()
             print(Fore.GREEN + f"\nSolved in {self.steps} steps!")
-            print(Fore.GREEN + f"Time taken: {self.solve_time:.2f} seconds")
+            print(Fore.GREEN + f"Time taken: {self.solve_time:.4f} seconds")
+            if self.engine == 'dlx':
+                count = DancingLinksSolver(self.box).count_solutions(entered, limit=2)
+                if count > 1:
+                    print(Fore.YELLOW + "This puzzle has more than one solution")
+                else:
+                    print(Fore.GREEN + "This puzzle has a unique solution")
         else:
             print(Fore.RED + "\nNo solution exists for this puzzle!")
 
@@ -179,7 +273,7 @@ class SudokuSolver:
                     if len(parts) != 3:
                         raise ValueError
                     row, col, val = map(int, parts)
-                    if not (0 <= row <= 8 and 0 <= col <= 8 and 1 <= val <= 9):
+                    if not (0 <= row < self.size and 0 <= col < self.size and 1 <= val <= self.size):
                         raise ValueError
                     if self.original_puzzle[row][col] != -1:
                         print(Fore.RED + "Cannot modify original clues!")
@@ -187,7 +281,8 @@ class SudokuSolver:
                         continue
                     self.puzzle[row][col] = val
                 except ValueError:
-                    print(Fore.RED + "Invalid input. Format as row,col,value (0-8,0-8,1-9)")
+                    last = self.size - 1
+                    print(Fore.RED + f"Invalid input. Format as row,col,value (0-{last},0-{last},1-{self.size})")
                     time.sleep(1)
 
     def select_difficulty(self):
@@ -199,7 +294,8 @@ class SudokuSolver:
             print(Fore.WHITE + "2. Medium")
             print(Fore.WHITE + "3. Hard")
             print(Fore.WHITE + "4. Custom")
-            print(Fore.WHITE + "5. Exit")
+            print(Fore.WHITE + f"5. Change grid size (now {self.size}x{self.size})")
+            print(Fore.WHITE + "6. Exit")
             
             choice = input(Fore.YELLOW + "> ").strip()
             
@@ -216,33 +312,55 @@ class SudokuSolver:
                 self.generate_custom_puzzle()
                 break
             elif choice == '5':
+                self.select_size()
+            elif choice == '6':
                 sys.exit()
             else:
-                print(Fore.RED + "Invalid choice. Please enter 1-5")
+                print(Fore.RED + "Invalid choice. Please enter 1-6")
                 time.sleep(1)
 
+    def select_size(self):
+        print(Fore.CYAN + "\nSelect Grid Size:")
+        print(Fore.WHITE + "1. 9x9")
+        print(Fore.WHITE + "2. 16x16")
+        print(Fore.WHITE + "3. 25x25")
+        box = {'1': 3, '2': 4, '3': 5}.get(input(Fore.YELLOW + "> ").strip())
+        if box is None:
+            print(Fore.RED + "Invalid choice, keeping the current size")
+            time.sleep(1)
+            return
+        self.box = box
+        self.size = box * box
+        self.puzzle = [[-1 for _ in range(self.size)] for _ in range(self.size)]
+        self.original_puzzle = None
+        self.difficulty = None
+
     def generate_custom_puzzle(self):
+        # The 9x9 clue limits, scaled to the current grid
+        scale = self.size ** 2 / 81
+        low, high = round(17 * scale), round(45 * scale)
         while True:
             try:
                 clear_screen()
                 self.print_banner()
-                clues = int(input(Fore.CYAN + "\nEnter number of clues (17-45): "))
-                if 17 <= clues <= 45:
+                clues = int(input(Fore.CYAN + f"\nEnter number of clues ({low}-{high}): "))
+                if low <= clues <= high:
                     break
-                print(Fore.RED + "Must be between 17 and 45")
+                print(Fore.RED + f"Must be between {low} and {high}")
                 time.sleep(1)
             except ValueError:
                 print(Fore.RED + "Please enter a number")
                 time.sleep(1)
         
-        difficulty = 'easy' if clues > 35 else 'medium' if clues > 26 else 'hard'
-        self.generate_puzzle(difficulty)
+        difficulty = 'easy' if clues > 35 * scale else 'medium' if clues > 26 * scale else 'hard'
+        self.generate_puzzle(difficulty, min_clues=clues)
 
 def clear_screen():
     print("\033c", end="")
 
 def main():
     solver = SudokuSolver()
+    solver.pool = PuzzlePool().start()
     
     while True:
         solver.select_difficulty()
@@ -0,0 +1,123 @@
+import argparse
+import functools
+import sys
+import time
+import numpy as np
+from colorama import Fore, Style
+
+FULL = 0x1FF
+# Byte -> bitmask lookup: digits 1-9 map to their bit, anything else to no bits
+DIGIT_BITS = np.zeros(256, dtype=np.int16)
+DIGIT_BITS[1:10] = [1 << d for d in range(9)]
+
+
+def to_array(puzzles):
+    """Nested-list puzzles (-1 for empty) -> (N, 9, 9) int8 array with 0 for empty."""
+    grids = np.asarray(puzzles, dtype=np.int8).reshape(-1, 9, 9)
+    return np.where(grids < 0, 0, grids).astype(np.int8)
+
+
+def parse_lines(data):
+    """Bytes of 81-character lines ('0' or '.' for empty) -> (N, 9, 9) int8 array."""
+    lines = [line.strip() for line in data.splitlines()]
+    lines = [line for line in lines if line and not line.startswith(b'#')]
+    if not lines:
+        return np.zeros((0, 9, 9), dtype=np.int8)
+    raw = np.frombuffer(b''.join(lines), dtype=np.uint8)
+    if raw.size != 81 * len(lines):
+        raise ValueError("Every line must have exactly 81 characters")
+    grids = raw.astype(np.int8) - ord('0')
+    grids[raw == ord('.')] = 0
+    return grids.reshape(-1, 9, 9)
+
+
+def digit_bits(grids):
+    """Bit d-1 set for digit d, 0 for empty cells."""
+    return DIGIT_BITS[np.asarray(grids, dtype=np.int8).view(np.uint8)]
+
+
+def reduce_units(values, ufunc):
+    """Combine every row, column and box with ufunc, each (N, 9)."""
+    # Folding nine slices is about twice as fast as ufunc.reduce over a length-9 axis
+    rows = functools.reduce(ufunc, [values[:, :, i] for i in range(9)])
+    cols = functools.reduce(ufunc, [values[:, i, :] for i in range(9)])
+    boxes = values.reshape(-1, 3, 3, 3, 3)
+    boxes = functools.reduce(ufunc, [boxes[:, :, i, :, j] for i in range(3) for j in range(3)])
+    return rows, cols, boxes.reshape(-1, 9)
+
+
+def unit_masks(grids):
+    """Digits used per row, column and box, each (N, 9)."""
+    return reduce_units(digit_bits(grids), np.bitwise_or)
+
+
+def candidate_masks(grids):
+    """(N, 9, 9) candidate bitmask for every empty cell, 0 for filled cells."""
+    rows, cols, boxes = unit_masks(grids)
+    box_per_cell = np.repeat(np.repeat(boxes.reshape(-1, 3, 3), 3, axis=1), 3, axis=2)
+    used = rows[:, :, None] | cols[:, None, :] | box_per_cell
+    return np.where(grids == 0, ~used & FULL, 0).astype(np.int16)
+
+
+def is_consistent(grids):
+    """True for grids with no repeated digit in any row, column or box."""
+    bits = digit_bits(np.asarray(grids))
+    # Without repeats the digit bits never overlap, so their sum equals their OR
+    consistent = np.ones(len(bits), dtype=bool)
+    for ors, sums in zip(reduce_units(bits, np.bitwise_or), reduce_units(bits, np.add)):
+        consistent &= (ors == sums).all(axis=1)
+    return consistent
+
+
+def is_solved(grids):
+    """True for complete grids where every row, column and box holds 1-9."""
+    grids = np.asarray(grids)
+    in_range = ((grids >= 1) & (grids <= 9)).all(axis=(1, 2))
+    rows, cols, boxes = unit_masks(grids)
+    return in_range & (rows == FULL).all(axis=1) & (cols == FULL).all(axis=1) & (boxes == FULL).all(axis=1)
+
+
+def has_dead_cell(grids):
+    """True for grids with an empty cell that no digit can fill."""
+    grids = np.asarray(grids)
+    return ((grids == 0) & (candidate_masks(grids) == 0)).any(axis=(1, 2))
+
+
+def validate_file(path, chunk_lines=1_000_000):
+    """Check every grid in a puzzle file, a chunk of lines at a time."""
+    totals = {'grids': 0, 'solved': 0, 'consistent': 0}
+    start = time.perf_counter()
+    with open(path, 'rb') as file:
+        while True:
+            lines = file.readlines(chunk_lines * 82)
+            if not lines:
+                break
+            grids = parse_lines(b''.join(lines))
+            totals['grids'] += len(grids)
+            totals['solved'] += int(is_solved(grids).sum())
+            totals['consistent'] += int(is_consistent(grids).sum())
+    totals['seconds'] = time.perf_counter() - start
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a file of 81-character Sudoku grids with NumPy")
+    parser.add_argument('input', help="one grid per line, '0' or '.' for empty cells")
+    args = parser.parse_args()
+
+    try:
+        totals = validate_file(args.input)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    rate = totals['grids'] / totals['seconds'] if totals['seconds'] else 0.0
+    print(f"\n{Fore.YELLOW}Checked {totals['grids']} grids in {totals['seconds']:.2f}s "
+          f"({rate:,.0f} grids/sec){Style.RESET_ALL}")
+    print(f"{Fore.GREEN}Solved: {totals['solved']}")
+    print(f"{Fore.CYAN}Consistent (no repeated digits): {totals['consistent']}")
+    print(f"{Fore.RED}Invalid: {totals['grids'] - totals['consistent']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,12 @@
 import random
 import re
-from collections import defaultdict
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, groupby
 import json
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from colorama import Fore, Style, init
 import nltk
 from nltk.tokenize import word_tokenize
@@ -12,9 +15,39 @@ from nltk.corpus import stopwords
 # Initialize colorama
 init(autoreset=True)
 
+# Token ids are packed ID_BITS apiece into one int per state
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
+# Characters of a training file tokenized at a time
+CHUNK_SIZE = 1 << 23
+# Transitions counted at a time before they are merged into the model
+BATCH_SIZE = 1 << 20
+
 class AdvancedMarkovChain:
+    """Markov chain over interned token ids.
+
+    Every distinct word is stored once in `vocab` and referred to by its
+    index, and a state of `order` ids is packed into a single int. `model`
+    maps each state to one int. Most states are only ever followed by one
+    word, so for those the int is (count << ID_BITS) | next id and nothing
+    else is stored. Any other state gets ~((start << ID_BITS) | length): a
+    span of the flat `next_ids` and `cum_counts` arrays holding the ids
+    that followed it and the running total of their counts. Memory grows
+    with the number of distinct transitions rather than with corpus length,
+    and sampling is a binary search within the span.
+    """
+
     def __init__(self, order: int = 2):
-        self.model: Dict[Tuple[str, ...], List[str]] = defaultdict(list)
+        self.vocab: List[str] = []
+        self.word_ids: Dict[str, int] = {}
+        # Packed state -> inline successor or ~span, see the class docstring
+        self.model: Dict[int, int] = {}
+        self.next_ids = array('I')
+        self.cum_counts = array('Q')
+        # Array slots left behind by spans that outgrew them, reclaimed by _compact
+        self._stale = 0
+        # (temperature, {packed state: cumulative tempered weights}) for the last temperature used
+        self._tempered: Tuple[float, Dict[int, array]] = (1.0, {})
         self.order = order
         self.stop_words = set(stopwords.words('english')) if 'english' in stopwords.fileids() else set()
         
@@ -37,28 +70,154 @@ class AdvancedMarkovChain:
         # tokens = [word for word in tokens if word not in self.stop_words]
         return tokens
 
+    def encode(self, words: List[str]) -> List[int]:
+        """Token ids of words, adding unseen words to the vocabulary."""
+        word_ids, vocab = self.word_ids, self.vocab
+        ids = []
+        for word in words:
+            token_id = word_ids.get(word)
+            if token_id is None:
+                token_id = word_ids[word] = len(vocab)
+                vocab.append(word)
+            ids.append(token_id)
+        return ids
+
+    def pack(self, ids) -> int:
+        """The state key of `order` token ids."""
+        key = 0
+        for token_id in ids:
+            key = (key << ID_BITS) | token_id
+        return key
+
+    def unpack(self, key: int) -> Tuple[int, ...]:
+        """The token ids of a state key."""
+        return tuple((key >> (ID_BITS * shift)) & ID_MASK for shift in reversed(range(self.order)))
+
+    def successors(self, key: int) -> Tuple[List[int], List[int]]:
+        """(next token ids, cumulative counts) of a state."""
+        value = self.model[key]
+        if value >= 0:
+            return [value & ID_MASK], [value >> ID_BITS]
+        start, length = ~value >> ID_BITS, ~value & ID_MASK
+        return self.next_ids[start:start + length].tolist(), self.cum_counts[start:start + length].tolist()
+
     def train(self, text: str) -> None:
         """Train the Markov model on the given text."""
-        words = self.preprocess_text(text)
+        tokens = self.preprocess_text(text)
         
-        if len(words) < self.order + 1:
+        if len(tokens) < self.order + 1:
             raise ValueError(f"Text is too short for order {self.order} Markov chain")
         
-        for i in range(len(words) - self.order):
-            state = tuple(words[i:i + self.order])
-            next_word = words[i + self.order]
-            self.model[state].append(next_word)
+        # Only the ids are kept, so each token's string can be freed straight away
+        ids = self.encode(tokens)
+        del tokens
+        self._add_transitions(ids)
+        self._compact()
 
     def train_from_file(self, file_path: str) -> None:
-        """Train the model from a text file."""
+        """Train the model from a text file, read and tokenized a chunk of lines at a time."""
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
-            self.train(text)
+                context: List[int] = []
+                tokens = 0
+                while True:
+                    lines = file.readlines(CHUNK_SIZE)
+                    if not lines:
+                        break
+                    # Carry the last state over so transitions across chunk boundaries are kept
+                    ids = context + self.encode(self.preprocess_text(''.join(lines)))
+                    self._add_transitions(ids)
+                    tokens += len(ids) - len(context)
+                    context = ids[-self.order:]
+            self._compact()
+            if tokens < self.order + 1:
+                raise ValueError(f"Text is too short for order {self.order} Markov chain")
             print(Fore.GREEN + f"Successfully trained model from {file_path}")
         except Exception as e:
             print(Fore.RED + f"Error reading file: {e}")
 
+    def _add_transitions(self, ids: List[int]) -> None:
+        """Count every (state, next id) pair in ids and merge the counts into the model."""
+        # Batches overlap by one state so no transition is lost or counted twice
+        for start in range(0, len(ids) - self.order, BATCH_SIZE):
+            self._add_batch(ids[start:start + BATCH_SIZE + self.order])
+        if self._stale > len(self.next_ids) // 2:
+            self._compact()
+        self._tempered = (1.0, {})
+
+    def _add_batch(self, ids: List[int]) -> None:
+        mask = (1 << (ID_BITS * self.order)) - 1
+        key = self.pack(ids[:self.order])
+        # Each (state, next id) pair packed into one int, so the counter holds no tuples
+        pairs = Counter()
+        for next_id in ids[self.order:]:
+            pairs[(key << ID_BITS) | next_id] += 1
+            key = ((key << ID_BITS) | next_id) & mask
+
+        # Sorted, a state's pairs are adjacent
+        for key, group in groupby(sorted(pairs), key=lambda pair: pair >> ID_BITS):
+            self._merge(key, {pair & ID_MASK: pairs[pair] for pair in group})
+
+    def _merge(self, key: int, counts: Dict[int, int]) -> None:
+        """Add next-id counts to a state, storing it inline or in a span as it needs."""
+        value = self.model.get(key)
+        if value is not None:
+            next_ids, cum_counts = self.successors(key)
+            previous = 0
+            for next_id, total in zip(next_ids, cum_counts):
+                counts[next_id] = counts.get(next_id, 0) + total - previous
+                previous = total
+        if len(counts) == 1:
+            (next_id, count), = counts.items()
+            self.model[key] = (count << ID_BITS) | next_id
+            return
+        if value is not None and value < 0 and len(counts) == ~value & ID_MASK:
+            # Same successors as before: rewrite the span in place
+            start = ~value >> ID_BITS
+        else:
+            if value is not None and value < 0:
+                self._stale += ~value & ID_MASK
+            # Append a new span; assigning past the end extends the arrays
+            start = len(self.next_ids)
+        end = start + len(counts)
+        self.next_ids[start:end] = array('I', counts.keys())
+        self.cum_counts[start:end] = array('Q', accumulate(counts.values()))
+        self.model[key] = ~((start << ID_BITS) | len(counts))
+
+    def _compact(self) -> None:
+        """Copy the live spans into fresh arrays, dropping the stale slots."""
+        if not self._stale:
+            return
+        next_ids, cum_counts = array('I'), array('Q')
+        for key, value in self.model.items():
+            if value < 0:
+                start, length = ~value >> ID_BITS, ~value & ID_MASK
+                self.model[key] = ~((len(next_ids) << ID_BITS) | length)
+                next_ids.extend(self.next_ids[start:start + length])
+                cum_counts.extend(self.cum_counts[start:start + length])
+        self.next_ids, self.cum_counts, self._stale = next_ids, cum_counts, 0
+
+    def _sample(self, key: int, temperature: float) -> int:
+        """A next token id for the state, drawn in proportion to count ** (1/temperature)."""
+        value = self.model[key]
+        if value >= 0:
+            return value & ID_MASK
+        start, length = ~value >> ID_BITS, ~value & ID_MASK
+        end = start + length
+        if temperature == 1.0:
+            return self.next_ids[bisect_right(self.cum_counts, random.randrange(self.cum_counts[end - 1]), start, end)]
+        # Only the latest temperature's weights are kept
+        if self._tempered[0] != temperature:
+            self._tempered = (temperature, {})
+        tempered = self._tempered[1]
+        cum_weights = tempered.get(key)
+        if cum_weights is None:
+            cum_counts = self.cum_counts[start:end]
+            counts = (total - previous for previous, total in zip([0, *cum_counts], cum_counts))
+            cum_weights = tempered[key] = array('d', accumulate(count ** (1 / temperature) for count in counts))
+        # min() guards against random() * total rounding up to total
+        return self.next_ids[start + min(bisect_right(cum_weights, random.random() * cum_weights[-1]), length - 1)]
+
     def generate(self, seed: str = None, length: int = 50, temperature: float = 1.0) -> str:
         """
         Generate text using the trained Markov model.
@@ -78,50 +237,46 @@ class AdvancedMarkovChain:
             seed_words = self.preprocess_text(seed)
             if len(seed_words) != self.order:
                 raise ValueError(f"Seed must contain exactly {self.order} words")
-            current_state = tuple(seed_words)
+            # Words never seen in training get no id, so such a seed matches no state
+            seed_ids = [self.word_ids.get(word) for word in seed_words]
+            current_state = None if None in seed_ids else self.pack(seed_ids)
             
             if current_state not in self.model:
-                similar = self._find_similar_state(current_state)
-                if similar:
+                similar = self._find_similar_state(seed_ids)
+                if similar is not None:
                     print(Fore.YELLOW + f"Warning: Seed not found, using similar state instead")
                     current_state = similar
                 else:
                     raise ValueError(f"Seed '{seed}' not found in model")
 
-        output = list(current_state)
+        output = list(self.unpack(current_state))
+        mask = (1 << (ID_BITS * self.order)) - 1
         
         for _ in range(length):
             if current_state not in self.model:
                 break
                 
-            next_words = self.model[current_state]
-            
-            # Apply temperature to control randomness
-            if temperature != 1.0:
-                counts = defaultdict(int)
-                for word in next_words:
-                    counts[word] += 1
-                total = len(next_words)
-                weights = [(count / total) ** (1/temperature) for count in counts.values()]
-                next_word = random.choices(list(counts.keys()), weights=weights, k=1)[0]
-            else:
-                next_word = random.choice(next_words)
+            # Temperature reshapes the counts: below 1 favours frequent words, above 1 flattens them
+            next_id = self._sample(current_state, temperature)
                 
-            output.append(next_word)
-            current_state = tuple(output[-self.order:])
+            output.append(next_id)
+            current_state = ((current_state << ID_BITS) | next_id) & mask
             
         # Capitalize first letter and add period if missing
-        generated = ' '.join(output)
+        generated = ' '.join(self.vocab[token_id] for token_id in output)
         generated = generated.capitalize()
         if not generated.endswith(('.', '!', '?')):
             generated += '.'
             
         return generated
 
-    def _find_similar_state(self, state: Tuple[str, ...]) -> Tuple[str, ...]:
+    def _find_similar_state(self, seed_ids: List[Optional[int]]) -> Optional[int]:
         """Find a similar state if exact match isn't found."""
+        known = {token_id for token_id in seed_ids if token_id is not None}
+        if not known:
+            return None
         for key in self.model.keys():
-            if any(word in key for word in state):
+            if known.intersection(self.unpack(key)):
                 return key
         return None
 
@@ -129,10 +284,11 @@ class AdvancedMarkovChain:
         """Save the trained model to a file."""
         try:
             with open(file_path, 'w', encoding='utf-8') as file:
-                # Convert defaultdict to regular dict and tuples to lists for JSON
+                # States are written as lists of token ids, independent of how they are packed
                 model_data = {
                     'order': self.order,
-                    'model': {' '.join(k): v for k, v in self.model.items()}
+                    'vocab': self.vocab,
+                    'model': [[self.unpack(key), *self.successors(key)] for key in self.model]
                 }
                 json.dump(model_data, file)
             print(Fore.GREEN + f"Model saved to {file_path}")
@@ -145,9 +301,19 @@ class AdvancedMarkovChain:
             with open(file_path, 'r', encoding='utf-8') as file:
                 model_data = json.load(file)
                 self.order = model_data['order']
-                self.model = defaultdict(list)
-                for k, v in model_data['model'].items():
-                    self.model[tuple(k.split())] = v
+                self.vocab, self.word_ids, self.model = [], {}, {}
+                self.next_ids, self.cum_counts, self._stale = array('I'), array('Q'), 0
+                self._tempered = (1.0, {})
+                if 'vocab' in model_data:
+                    self.vocab = model_data['vocab']
+                    self.word_ids = {word: token_id for token_id, word in enumerate(self.vocab)}
+                    for state, next_ids, cum_counts in model_data['model']:
+                        counts = [total - previous for previous, total in zip([0, *cum_counts], cum_counts)]
+                        self._merge(self.pack(state), dict(zip(next_ids, counts)))
+                else:
+                    # Older saves list every next word occurrence under a space-joined state
+                    for k, v in model_data['model'].items():
+                        self._merge(self.pack(self.encode(k.split())), Counter(self.encode(v)))
             print(Fore.GREEN + f"Model loaded from {file_path}")
         except Exception as e:
             print(Fore.RED + f"Error loading model: {e}")